@@ -4,29 +4,104 @@ Handles camera operations and video display
 """
 
 import cv2
+import numpy as np
+import pyautogui
+import queue
+import sys
 import threading
 import time
 import tkinter as tk
 from tkinter import messagebox
 
+# Per-frame OpenCV calls are tiny; thread pool wakeups and OpenCL probing
+# cost more than they save, and parallelism comes from our own threads
+cv2.setNumThreads(1)
+cv2.ocl.setUseOpenCL(False)
+
+# Default width of the frame handed to MediaPipe (the "inference_width" setting);
+# the preview stays at full resolution
+INFERENCE_WIDTH = 480
+
+# A grab slower than this waited for a live frame instead of a buffered one
+LIVE_GRAB_SECONDS = 0.005
+
+# Upper bound on grabs per read; the timing check above usually stops sooner.
+# Backends that ignore CAP_PROP_BUFFERSIZE keep several frames queued
+DRAIN_MAX_GRABS = 4
+
+# Seconds to wait for each worker thread when stopping the camera
+STOP_JOIN_TIMEOUT = 1.0
+
+# Translucent instructions box on the camera feed (x1, y1, x2, y2)
+OVERLAY_BOX = (10, 10, 630, 200)
+
+# Area holding the gesture/confidence/FPS lines (x1, y1, x2, y2)
+INFO_BOX = (10, 200, 410, 295)
+
+# Instructions text (from original)
+CAMERA_INSTRUCTIONS = [
+    "Point finger to move cursor",
+    "Pinch to click", 
+    "Peace sign for right click",
+    "1-4 fingers for bookmarks",
+    "All fingers to move cursor",
+    "Press 'q' to quit"
+]
+
 class CameraController:
-    def __init__(self, settings, gesture_detector):
+    def __init__(self, settings, gesture_detector, update_queue=None):
         self.settings = settings
         self.gesture_detector = gesture_detector
+        self.update_queue = update_queue  # Optional (fps, gesture, confidence) feed for the GUI
+        self._last_stats = None
         self.cap = None
         self.is_running = False
         self.camera_thread = None
+        self.reader_thread = None
+        self.display_thread = None
         self.camera_window = None
         
+        # Screen size for cursor mapping
+        self.wScr, self.hScr = pyautogui.size()
+        
+        # Latest captured frame (reader -> camera loop) and latest processed
+        # frame (camera loop -> display loop)
+        self.frame_queue = queue.Queue(maxsize=1)
+        self.display_queue = queue.Queue(maxsize=1)
+        
         # Performance tracking
         self.fps_counter = 0
         self.fps_start_time = time.time()
         self.current_fps = 0
         
+        # Inference throttling: detect hands every Nth frame only
+        self._infer_every = 2
+        self._frame_idx = 0
+        self._last_result = None
+        
+        # Reused RGB buffer for the inference frame, and its width
+        self._rgb_buf = None
+        self._inference_width = settings.get("inference_width", INFERENCE_WIDTH)
+        
+        # Static instructions overlay, rendered once
+        self._instructions_mask = self._render_instructions_mask()
+        
+        # Last rendered gesture/confidence/FPS text and its mask
+        self._info_lines = None
+        self._info_mask = None
+        
     def initialize_camera(self):
         """Initialize camera with settings"""
         try:
-            self.cap = cv2.VideoCapture(0)
+            # DirectShow opens faster and honours MJPG on Windows
+            if sys.platform == "win32":
+                self.cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
+            else:
+                self.cap = cv2.VideoCapture(0)
+            
+            # Ask for compressed MJPG frames before choosing the resolution,
+            # raw YUY2 saturates USB bandwidth on many webcams at 720p
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
             
             # Set camera resolution
             width, height = self.settings["camera_resolution"]
@@ -36,6 +111,10 @@ class CameraController:
             # Set FPS if possible
             self.cap.set(cv2.CAP_PROP_FPS, 30)
             
+            # Keep only the newest frame queued to avoid lag; not every
+            # backend honours this, so stale frames are also drained on read
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            
             if not self.cap.isOpened():
                 raise Exception("Cannot open camera")
             
@@ -53,8 +132,22 @@ class CameraController:
             return False
         
         self.is_running = True
+        self.frame_queue = queue.Queue(maxsize=1)
+        self.display_queue = queue.Queue(maxsize=1)
+        self._frame_idx = 0
+        self._last_result = None
+        self._last_stats = None
+        
+        # Frame reading overlaps with detection and rendering
+        self.reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+        self.reader_thread.start()
+        
         self.camera_thread = threading.Thread(target=self._camera_loop, daemon=True)
         self.camera_thread.start()
+        
+        # Drawing and imshow run alongside detection of the next frame
+        self.display_thread = threading.Thread(target=self._display_loop, daemon=True)
+        self.display_thread.start()
         return True
     
     def stop_camera(self):
@@ -62,9 +155,12 @@ class CameraController:
         print("🛑 Stopping camera...")
         self.is_running = False
         
-        # Wait a moment for the camera loop to stop
-        import time
-        time.sleep(0.5)
+        # Wait (bounded) for the worker threads to see the flag, so the capture
+        # isn't released mid-read; the camera loop itself ends by calling this
+        current = threading.current_thread()
+        for thread in (self.reader_thread, self.camera_thread, self.display_thread):
+            if thread and thread is not current and thread.is_alive():
+                thread.join(timeout=STOP_JOIN_TIMEOUT)
         
         # Clean up camera
         if self.cap:
@@ -80,110 +176,100 @@ class CameraController:
         except Exception as e:
             print(f"Error closing windows: {e}")
         
-        # Don't join the thread from within itself
-        # Just set the flag and let it finish naturally
-        
         print("🧹 Camera cleaned up")
     
     def _camera_loop(self):
-        """Main camera loop with better error handling"""
-        # Get screen size for cursor mapping
-        import pyautogui
-        wScr, hScr = pyautogui.size()
-        
-        # Create always-on-top camera window
-        self._setup_camera_window()
-        
-        try:
-            while self.is_running:
-                if not self.cap or not self.cap.isOpened():
-                    print("❌ Camera not available")
-                    break
+        """Main camera loop"""
+        while self.is_running:
+            try:
+                try:
+                    img = self.frame_queue.get(timeout=1.0)
+                except queue.Empty:
+                    continue
                 
-                success, img = self.cap.read()
-                if not success:
+                if img is None:
                     print("❌ Failed to read camera frame")
                     break
                 
-                # Flip image for mirror effect (from original)
-                img = cv2.flip(img, 1)
-                img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+                # Flip image for mirror effect (from original), in place since
+                # the frame is owned by this loop until it reaches the display
+                cv2.flip(img, 1, dst=img)
+                h, w, _ = img.shape
                 
-                # Process hand detection only if gesture detector is available
-                if self.gesture_detector and self.gesture_detector.hands:
-                    try:
-                        result_hands = self.gesture_detector.hands.process(img_rgb)
-                        h, w, _ = img.shape
-                        
-                        # Process gestures and get current gesture info
-                        gesture_name, confidence = self.gesture_detector.process_gesture_commands(
-                            result_hands, img, wScr, hScr, w, h
-                        )
-                    except Exception as e:
-                        print(f"Gesture processing error: {e}")
-                        gesture_name, confidence = "Error", 0.0
-                else:
-                    gesture_name, confidence = "No Detector", 0.0
+                # Hand detection only runs every Nth frame; in between the
+                # last landmarks are reused and smoothing keeps the cursor fluid
+                self._frame_idx += 1
+                if self._last_result is None or self._frame_idx % self._infer_every == 0:
+                    self._last_result = self._detect_hands(img, w, h)
+                result_hands = self._last_result
                 
-                # Add UI elements to camera feed
-                self._add_camera_ui(img, gesture_name, confidence)
+                # Process gestures and get current gesture info
+                gesture_name, confidence = self.gesture_detector.process_gesture_commands(
+                    result_hands, img, self.wScr, self.hScr, w, h
+                )
                 
                 # Update performance counter
                 self._update_fps()
                 
-                # Display the camera feed
-                window_name = "🖱️ Gesture Cursor Controller - Camera Feed"
-                cv2.imshow(window_name, img)
-                
-                # Make window always on top and non-minimizable
-                self._maintain_window_properties()
+                # Publish stats for the GUI thread, only when something changed
+                if self.update_queue is not None:
+                    stats = (self.current_fps, gesture_name, confidence)
+                    if stats != self._last_stats:
+                        self._last_stats = stats
+                        self._put_latest(self.update_queue, stats)
                 
-                # Check for quit (but don't rely on it for stopping)
-                if cv2.waitKey(1) & 0xFF == ord('q'):
-                    break
+                # Hand the frame to the display thread, dropping any stale one
+                self._put_latest(self.display_queue, (img, gesture_name, confidence))
                     
-        except Exception as e:
-            print(f"Camera loop error: {e}")
-        finally:
-            # Clean shutdown
-            self.is_running = False
-            print("🎥 Camera loop ended")
+            except Exception as e:
+                print(f"Camera loop error: {e}")
+                break
+        
+        self.stop_camera()
     
-    def _camera_loop(self):
-        """Main camera loop"""
-        # Get screen size for cursor mapping
-        import pyautogui
-        wScr, hScr = pyautogui.size()
+    def _detect_hands(self, img, w, h):
+        """Run MediaPipe hand detection on a downscaled RGB copy of the frame"""
+        # Landmarks are normalized, so they still map onto the full-size frame
+        width = self._inference_width
+        if w > width:
+            small = cv2.resize(img, (width, int(h * width / w)),
+                               interpolation=cv2.INTER_AREA)
+        else:
+            small = img
+        if self._rgb_buf is None or self._rgb_buf.shape != small.shape:
+            self._rgb_buf = np.empty_like(small)
+        img_rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         
+        return self.gesture_detector.hands.process(img_rgb)
+    
+    def _grab_latest(self, cap):
+        """Discard frames queued in the driver and decode only the newest one"""
+        for _ in range(DRAIN_MAX_GRABS):
+            start = time.perf_counter()
+            if not cap.grab():
+                return False, None
+            
+            # A grab that had to wait for the camera means the buffer is empty
+            if time.perf_counter() - start > LIVE_GRAB_SECONDS:
+                break
+        
+        return cap.retrieve()
+    
+    def _display_loop(self):
+        """Annotate and show frames while the camera loop processes the next one"""
         # Create always-on-top camera window
         self._setup_camera_window()
         
         while self.is_running:
             try:
-                success, img = self.cap.read()
-                if not success:
-                    print("❌ Failed to read camera frame")
-                    break
-                
-                # Flip image for mirror effect (from original)
-                img = cv2.flip(img, 1)
-                img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-                
-                # Process hand detection
-                result_hands = self.gesture_detector.hands.process(img_rgb)
-                h, w, _ = img.shape
-                
-                # Process gestures and get current gesture info
-                gesture_name, confidence = self.gesture_detector.process_gesture_commands(
-                    result_hands, img, wScr, hScr, w, h
-                )
+                try:
+                    img, gesture_name, confidence = self.display_queue.get(timeout=1.0)
+                except queue.Empty:
+                    continue
                 
                 # Add UI elements to camera feed
                 self._add_camera_ui(img, gesture_name, confidence)
                 
-                # Update performance counter
-                self._update_fps()
-                
                 # Display the camera feed
                 cv2.imshow("🖱️ Gesture Cursor Controller - Camera Feed", img)
                 
@@ -192,13 +278,36 @@ class CameraController:
                 
                 # Check for quit (but don't rely on it for stopping)
                 if cv2.waitKey(1) & 0xFF == ord('q'):
-                    break
+                    self.is_running = False
                     
             except Exception as e:
-                print(f"Camera loop error: {e}")
+                print(f"Camera display error: {e}")
+                self.is_running = False
+    
+    def _put_latest(self, q, item):
+        """Put an item into a size-1 queue, replacing any unconsumed one"""
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+            q.put_nowait(item)
+    
+    def _reader_loop(self):
+        """Read frames into the queue, keeping only the newest one"""
+        while self.is_running:
+            cap = self.cap
+            success, frame = self._grab_latest(cap) if cap else (False, None)
+            if not success:
+                frame = None
+            
+            # Drop the stale frame if the camera loop hasn't picked it up yet
+            self._put_latest(self.frame_queue, frame)
+            
+            if frame is None:
                 break
-        
-        self.stop_camera()
     
     def _setup_camera_window(self):
         """Setup camera window properties"""
@@ -220,37 +329,53 @@ class CameraController:
         except:
             pass
     
+    def _render_instructions_mask(self):
+        """Render the static instructions text into a boolean mask"""
+        x1, y1, x2, y2 = OVERLAY_BOX
+        layer = np.zeros((y2 - y1 + 1, x2 - x1 + 1), np.uint8)
+        
+        for i, instruction in enumerate(CAMERA_INSTRUCTIONS):
+            cv2.putText(layer, instruction, (15 - x1, 35 + i * 25 - y1), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, 255, 2)
+        
+        return layer > 0
+    
+    def _render_info_mask(self, info_lines):
+        """Render the gesture/confidence/FPS lines into a boolean mask"""
+        x1, y1, x2, y2 = INFO_BOX
+        layer = np.zeros((y2 - y1 + 1, x2 - x1 + 1), np.uint8)
+        
+        for i, line in enumerate(info_lines):
+            cv2.putText(layer, line, (15 - x1, 220 + i * 30 - y1), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, 255, 2)
+        
+        return layer > 0
+    
     def _add_camera_ui(self, img, gesture_name, confidence):
         """Add UI elements to camera image"""
         # Add instructions overlay (from original but enhanced)
         overlay_alpha = 0.7
-        overlay = img.copy()
         
-        # Semi-transparent background for text
-        cv2.rectangle(overlay, (10, 10), (630, 200), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, overlay_alpha, img, 1 - overlay_alpha, 0, img)
+        # Semi-transparent background for text, blended only inside its box
+        roi = img[OVERLAY_BOX[1]:OVERLAY_BOX[3] + 1, OVERLAY_BOX[0]:OVERLAY_BOX[2] + 1]
+        cv2.addWeighted(roi, 1 - overlay_alpha, roi, 0, 0, dst=roi)
         
-        # Instructions text (from original)
-        instructions = [
-            "Point finger to move cursor",
-            "Pinch to click", 
-            "Peace sign for right click",
-            "1-4 fingers for bookmarks",
-            "All fingers to move cursor",
-            "Press 'q' to quit"
-        ]
+        # Instructions text, pre-rendered once into a mask
+        roi_h, roi_w = roi.shape[:2]
+        roi[self._instructions_mask[:roi_h, :roi_w]] = 255
         
-        for i, instruction in enumerate(instructions):
-            cv2.putText(img, instruction, (15, 35 + i * 25), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        # Current gesture info, re-rendered only when the text changes
+        info_lines = (f"Gesture: {gesture_name}",
+                      f"Confidence: {confidence:.1%}",
+                      f"FPS: {self.current_fps:.1f}")
+        if info_lines != self._info_lines:
+            self._info_lines = info_lines
+            self._info_mask = self._render_info_mask(info_lines)
         
-        # Current gesture info
-        cv2.putText(img, f"Gesture: {gesture_name}", (15, 220), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-        cv2.putText(img, f"Confidence: {confidence:.1%}", (15, 250), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-        cv2.putText(img, f"FPS: {self.current_fps:.1f}", (15, 280), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+        x1, y1, x2, y2 = INFO_BOX
+        roi = img[y1:y2 + 1, x1:x2 + 1]
+        roi_h, roi_w = roi.shape[:2]
+        roi[self._info_mask[:roi_h, :roi_w]] = (0, 255, 0)
         
         # Status indicator
         status_color = (0, 255, 0) if gesture_name != "None" else (0, 0, 255)
@@ -0,0 +1,59 @@
+"""
+Cursor Module
+Fast native cursor positioning without PyAutoGUI overhead
+"""
+
+import sys
+import pyautogui
+
+if sys.platform == "win32":
+    import ctypes
+    _user32 = ctypes.windll.user32
+else:
+    _user32 = None
+
+try:
+    from Xlib import display as xdisplay
+    XLIB_AVAILABLE = True
+except ImportError:
+    XLIB_AVAILABLE = False
+
+try:
+    import Quartz
+    QUARTZ_AVAILABLE = True
+except ImportError:
+    QUARTZ_AVAILABLE = False
+
+_x_display = None
+
+def _move_x11(x, y):
+    """Warp the pointer on X11 using a cached display connection"""
+    global _x_display
+    if _x_display is None:
+        _x_display = xdisplay.Display()
+    _x_display.screen().root.warp_pointer(x, y)
+    _x_display.flush()
+
+def _move_quartz(x, y):
+    """Move the pointer on macOS by posting a mouse-moved event"""
+    # CGWarpMouseCursorPosition would skip the event, so apps never see hover
+    event = Quartz.CGEventCreateMouseEvent(None, Quartz.kCGEventMouseMoved, (x, y),
+                                           Quartz.kCGMouseButtonLeft)
+    Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+def _move_pyautogui(x, y):
+    """Fallback when no native backend is available"""
+    pyautogui.moveTo(x, y, _pause=False)
+
+def move_cursor(x, y):
+    """Move the mouse cursor to screen coordinates (x, y)"""
+    _move(int(x), int(y))
+
+if _user32 is not None:
+    _move = _user32.SetCursorPos
+elif sys.platform.startswith("linux") and XLIB_AVAILABLE:
+    _move = _move_x11
+elif sys.platform == "darwin" and QUARTZ_AVAILABLE:
+    _move = _move_quartz
+else:
+    _move = _move_pyautogui
@@ -0,0 +1,74 @@
+"""
+Frame Grabber Module
+Reads camera frames on a background thread so processing always gets the newest one
+"""
+
+import threading
+
+# Seconds read() waits for a new frame before giving up
+READ_TIMEOUT = 2.0
+
+# Pixel stride of the sparse sample used by frame_signature
+SIGNATURE_STRIDE = 32
+
+def frame_signature(frame):
+    """Cheap fingerprint of a frame (green channel sampled on a sparse grid)"""
+    # Webcams often re-deliver an identical frame; equal signatures mean
+    # the previous hand detection result can be reused
+    return int(frame[::SIGNATURE_STRIDE, ::SIGNATURE_STRIDE, 1].sum())
+
+class FrameGrabber:
+    """Single-slot frame buffer filled by a daemon reader thread"""
+    
+    def __init__(self, cap):
+        self.cap = cap
+        self.frame = None
+        self.success = True
+        self.is_running = False
+        self.thread = None
+        
+        # Guards the slot; _fresh is set when a frame hasn't been handed out yet
+        self._cond = threading.Condition()
+        self._fresh = False
+    
+    def start(self):
+        """Start reading frames in the background"""
+        self.is_running = True
+        self.thread = threading.Thread(target=self._reader_loop, daemon=True)
+        self.thread.start()
+        return self
+    
+    def _reader_loop(self):
+        """Keep overwriting the slot with the latest frame"""
+        while self.is_running:
+            success, frame = self.cap.read()
+            with self._cond:
+                self.success = success
+                self.frame = frame
+                self._fresh = True
+                self._cond.notify()
+            
+            if not success:
+                break
+        
+        self.is_running = False
+    
+    def read(self, timeout=READ_TIMEOUT):
+        """Return (success, frame) for the newest frame not returned before"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._fresh or not self.is_running, timeout):
+                return False, None
+            if not self._fresh:
+                return False, None
+            
+            self._fresh = False
+            return self.success, self.frame
+    
+    def stop(self, timeout=1.0):
+        """Stop the reader thread (call before releasing the capture)"""
+        self.is_running = False
+        with self._cond:
+            self._cond.notify_all()
+        
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=timeout)
@@ -11,6 +11,31 @@ import math
 import time
 import webbrowser
 
+from core.cursor import move_cursor
+
+# Landmark ids of the index/middle/ring/pinky tips and their PIP joints
+FINGER_TIPS = np.array([8, 12, 16, 20])
+FINGER_PIPS = np.array([6, 10, 14, 18])
+
+# Index-thumb distance (pixels) below which the hand counts as pinching
+PINCH_DISTANCE = 40
+
+# Bit weights for packing finger states (thumb, index, middle, ring, pinky)
+FINGER_BITS = np.array([16, 8, 4, 2, 1])
+
+# SIMPLIFIED GESTURE SET - finger-state key -> gesture name
+GESTURE_TABLE = {
+    0b00001: "Pinky",         # Only pinky up - RIGHT CLICK
+    0b01000: "One Finger",    # Only index finger - BOOKMARK 1
+    0b01100: "Two Fingers",   # Index + Middle - BOOKMARK 2
+    0b01001: "Index Pinky",   # Index + Pinky (rock sign) - BOOKMARK 3
+    0b01111: "Four Fingers"   # 4 fingers (no thumb) - CURSOR MOVEMENT
+}
+
+def to_pixel(point):
+    """Convert a landmark row to an integer (x, y) tuple for OpenCV drawing"""
+    return int(point[0]), int(point[1])
+
 class GestureDetector:
     def __init__(self, settings):
         self.settings = settings
@@ -27,136 +52,129 @@ class GestureDetector:
         self.current_gesture = "None"
         self.gesture_confidence = 0
         
-        # Initialize MediaPipe based on GPU setting
+        # Cached camera -> screen scale factors
+        self._scale_dims = None
+        self._sx = self._sy = None
+        
+        # Landmark pixel coordinates, reused every frame
+        self._lm = np.empty((21, 2), np.float32)
+        
+        # Per-frame values derived from settings
+        self.refresh_settings()
+        
+        # Initialize MediaPipe based on model settings
         self.initialize_mediapipe()
         
-        # Configure PyAutoGUI (from original)
+        # Configure PyAutoGUI (clicks are already rate limited, so no extra pause)
         pyautogui.FAILSAFE = False
-        pyautogui.PAUSE = 0.01
+        pyautogui.PAUSE = 0
     
     def initialize_mediapipe(self):
         """Initialize MediaPipe with appropriate settings"""
         try:
-            if self.settings["use_gpu"]:
-                self.hands = self.mp_hands.Hands(
-                    max_num_hands=1, 
-                    min_detection_confidence=0.7,
-                    min_tracking_confidence=0.5,
-                    model_complexity=1
-                )
-            else:
-                self.hands = self.mp_hands.Hands(
-                    max_num_hands=1, 
-                    min_detection_confidence=0.7,
-                    min_tracking_confidence=0.5
-                )
+            # Lite model (0) is ~2x faster and accurate enough for one hand;
+            # the full model (1) is opt-in via the "model_complexity" setting
+            self.hands = self.mp_hands.Hands(
+                max_num_hands=1, 
+                min_detection_confidence=0.7,
+                min_tracking_confidence=0.5,
+                model_complexity=self.settings.get("model_complexity", 0)
+            )
             print("✅ MediaPipe hands initialized successfully")
         except Exception as e:
             print(f"❌ Error initializing MediaPipe: {e}")
             self.hands = None
     
+    def refresh_settings(self):
+        """Cache values derived from settings (call after settings change)"""
+        self._alpha_q = int(self.settings["cursor_sensitivity"] * 256)
+        self._ialpha_q = 256 - self._alpha_q
+        self._stab_sq = int(self.settings["stability_zone"]) ** 2
+        self._show_visual_feedback = self.settings["show_visual_feedback"]
+        self._gesture_threshold = self.settings["gesture_threshold"]
+    
     def get_distance(self, p1, p2):
-        """Calculate distance between two points (from original)"""
+        """Calculate distance between two points or landmark rows"""
         return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
     
     def detect_fingers(self, lmList):
-        """Detect finger states (from original logic)"""
+        """Detect finger states (from original logic, vectorized)"""
         if len(lmList) < 21:
-            return []
+            return np.zeros(0, np.int8)
         
-        fingers_up = []
+        fingers_up = np.empty(5, np.int8)
         
         # Thumb (from original)
-        fingers_up.append(1 if lmList[4][0] > lmList[3][0] else 0)
+        fingers_up[0] = lmList[4, 0] > lmList[3, 0]
         
-        # Index (from original)
-        fingers_up.append(1 if lmList[8][1] < lmList[6][1] else 0)
-        
-        # Middle (from original)
-        fingers_up.append(1 if lmList[12][1] < lmList[10][1] else 0)
-        
-        # Ring (from original)
-        fingers_up.append(1 if lmList[16][1] < lmList[14][1] else 0)
-        
-        # Pinky (from original)
-        fingers_up.append(1 if lmList[20][1] < lmList[18][1] else 0)
+        # Index, middle, ring, pinky: tip above PIP joint
+        fingers_up[1:] = lmList[FINGER_TIPS, 1] < lmList[FINGER_PIPS, 1]
         
         return fingers_up
     
     def detect_gesture(self, hand_landmarks, w, h):
         """Detect hand gesture - SIMPLIFIED with only working gestures"""
-        lmList = []
-        for id, lm in enumerate(hand_landmarks.landmark):
-            cx, cy = int(lm.x * w), int(lm.y * h)
-            lmList.append((cx, cy))
+        if len(hand_landmarks.landmark) < 21:
+            return "Unknown", 0.0, self._lm[:0]
         
-        if len(lmList) < 21:
-            return "Unknown", 0.0, lmList
+        # Fill the persistent landmark buffer in one pass, then scale to pixels
+        lmList = self._lm
+        lmList.reshape(-1)[:] = np.fromiter(
+            (c for p in hand_landmarks.landmark for c in (p.x, p.y)),
+            dtype=np.float32, count=lmList.size)
+        lmList *= (w, h)
         
-        # Get finger states using original logic
-        fingers_up = self.detect_fingers(lmList)
-        finger_count = sum(fingers_up)
+        # Get finger states packed into a 5-bit key (thumb is the high bit)
+        fingers_key = int(self.detect_fingers(lmList).dot(FINGER_BITS))
         
         # Get key positions (from original)
         index_tip = lmList[8]
         thumb_tip = lmList[4]
-        pinky_tip = lmList[20]
         
-        # Calculate pinch distance (from original)
-        pinch_distance = self.get_distance(index_tip, thumb_tip)
+        # Squared pinch distance, compared against the squared threshold
+        dx = index_tip[0] - thumb_tip[0]
+        dy = index_tip[1] - thumb_tip[1]
         
         confidence = 0.9  # High confidence for working gestures
         
-        # SIMPLIFIED GESTURE SET - Only 6 working gestures
-        
         # 1. Pinch detection (from original) - LEFT CLICK
-        if pinch_distance < 40:
+        if dx * dx + dy * dy < PINCH_DISTANCE * PINCH_DISTANCE:
             return "Pinch", confidence, lmList
         
-        # 2. Pinky only - RIGHT CLICK  
-        elif fingers_up == [0, 0, 0, 0, 1]:  # Only pinky up
-            return "Pinky", confidence, lmList
-        
-        # 3. Index only - BOOKMARK 1
-        elif fingers_up == [0, 1, 0, 0, 0]:  # Only index finger
-            return "One Finger", confidence, lmList
-        
-        # 4. Index + Middle - BOOKMARK 2
-        elif fingers_up == [0, 1, 1, 0, 0]:  # Index + Middle
-            return "Two Fingers", confidence, lmList
-        
-        # 5. Index + Pinky (rock sign) - BOOKMARK 3
-        elif fingers_up == [0, 1, 0, 0, 1]:  # Index + Pinky
-            return "Index Pinky", confidence, lmList
-        
-        # 6. Four fingers (no thumb) - CURSOR MOVEMENT
-        elif fingers_up == [0, 1, 1, 1, 1]:  # 4 fingers (no thumb)
-            return "Four Fingers", confidence, lmList
-        
-        else:
+        # 2-6. Finger-state gestures, see GESTURE_TABLE
+        gesture_name = GESTURE_TABLE.get(fingers_key)
+        if gesture_name is None:
             return "Unknown", 0.3, lmList
+        return gesture_name, confidence, lmList
     
     def process_cursor_movement(self, lmList, wScr, hScr, w, h):
         """Process cursor movement (from original with smoothing)"""
-        index_tip = lmList[8]
+        index_tip = to_pixel(lmList[8])
         x1, y1 = index_tip
         
-        # Original screen mapping
-        screen_x = np.interp(x1, [0, w], [0, wScr])
-        screen_y = np.interp(y1, [0, h], [0, hScr])
+        # Camera -> screen scale factors, recomputed only when sizes change
+        if self._scale_dims != (w, h, wScr, hScr):
+            self._scale_dims = (w, h, wScr, hScr)
+            self._sx = wScr / w
+            self._sy = hScr / h
+        
+        # Screen mapping, clamped to the screen like the original np.interp
+        screen_x = min(max(int(x1 * self._sx), 0), wScr)
+        screen_y = min(max(int(y1 * self._sy), 0), hScr)
         
         # Apply smoothing factor
         if self.prev_x == 0 and self.prev_y == 0:
             self.prev_x, self.prev_y = screen_x, screen_y
         
-        smoothing_factor = self.settings["cursor_sensitivity"]
-        smoothed_x = self.prev_x * (1 - smoothing_factor) + screen_x * smoothing_factor
-        smoothed_y = self.prev_y * (1 - smoothing_factor) + screen_y * smoothing_factor
+        # Fixed-point EMA (8 fractional bits), pixel accuracy is all we need
+        smoothed_x = (self.prev_x * self._ialpha_q + screen_x * self._alpha_q) >> 8
+        smoothed_y = (self.prev_y * self._ialpha_q + screen_y * self._alpha_q) >> 8
         
-        # Apply stability zone
-        distance_moved = self.get_distance((self.prev_x, self.prev_y), (smoothed_x, smoothed_y))
-        if distance_moved > self.settings["stability_zone"]:
-            pyautogui.moveTo(smoothed_x, smoothed_y)
+        # Apply stability zone (squared distances, no sqrt needed)
+        dx = smoothed_x - self.prev_x
+        dy = smoothed_y - self.prev_y
+        if dx * dx + dy * dy > self._stab_sq:
+            move_cursor(smoothed_x, smoothed_y)
             self.prev_x, self.prev_y = smoothed_x, smoothed_y
         
         return index_tip
@@ -170,9 +188,9 @@ class GestureDetector:
             pyautogui.click()
             self.last_click_time = current_time
             
-            if self.settings["show_visual_feedback"]:
-                index_tip = lmList[8]
-                thumb_tip = lmList[4]
+            if self._show_visual_feedback:
+                index_tip = to_pixel(lmList[8])
+                thumb_tip = to_pixel(lmList[4])
                 cv2.circle(img, index_tip, 15, (0, 0, 255), 3)
                 cv2.circle(img, thumb_tip, 15, (0, 0, 255), 3)
                 cv2.line(img, index_tip, thumb_tip, (0, 0, 255), 3)
@@ -188,8 +206,8 @@ class GestureDetector:
             pyautogui.rightClick()
             self.last_right_click_time = current_time
             
-            if self.settings["show_visual_feedback"]:
-                pinky_tip = lmList[20]
+            if self._show_visual_feedback:
+                pinky_tip = to_pixel(lmList[20])
                 cv2.circle(img, pinky_tip, 15, (255, 255, 0), 3)
                 cv2.putText(img, 'RIGHT CLICK!', (pinky_tip[0], pinky_tip[1] - 40), 
                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
@@ -217,7 +235,7 @@ class GestureDetector:
                         webbrowser.open(url)
                         self.last_gesture_time = current_time
                         
-                        if self.settings["show_visual_feedback"]:
+                        if self._show_visual_feedback:
                             cv2.putText(img, f'OPENING BOOKMARK {bookmark_index + 1}', 
                                        (10, 150), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
                     except Exception as e:
@@ -225,50 +243,55 @@ class GestureDetector:
     
     def process_gesture_commands(self, result_hands, img, wScr, hScr, w, h):
         """Main gesture processing function - SIMPLIFIED"""
-        if not result_hands.multi_hand_landmarks:
+        hands = result_hands.multi_hand_landmarks
+        if not hands:
+            self.current_gesture = "None"
+            self.gesture_confidence = 0.0
             return "None", 0.0
         
-        for hand_landmarks in result_hands.multi_hand_landmarks:
-            # Draw landmarks
-            if self.settings["show_visual_feedback"]:
-                self.mp_draw.draw_landmarks(img, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-            
-            # Detect gesture
-            gesture_name, confidence, lmList = self.detect_gesture(hand_landmarks, w, h)
-            
-            # Only process if confidence is above threshold
-            if confidence < self.settings["gesture_threshold"]:
-                continue
-            
-            # Store current gesture info
-            self.current_gesture = gesture_name
-            self.gesture_confidence = confidence
-            
-            # Process gestures
-            if gesture_name == "Four Fingers":
-                # Move cursor
-                cursor_pos = self.process_cursor_movement(lmList, wScr, hScr, w, h)
-                
-                if self.settings["show_visual_feedback"]:
-                    cv2.circle(img, cursor_pos, 8, (0, 255, 0), -1)
-                    cv2.putText(img, 'CURSOR', (cursor_pos[0] + 15, cursor_pos[1] - 15), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-            
-            elif gesture_name == "Pinch":
-                # Left click
-                self.process_left_click(lmList, img)
-            
-            elif gesture_name == "Pinky":
-                # Right click  
-                self.process_right_click(lmList, img)
-            
-            elif gesture_name in ["One Finger", "Two Fingers", "Index Pinky"]:
-                # Bookmarks (only 3)
-                self.process_bookmarks(gesture_name, img, lmList)
+        # Single-hand detector, so only the first hand matters
+        hand_landmarks = hands[0]
+        
+        # Draw landmarks
+        if self._show_visual_feedback:
+            self.mp_draw.draw_landmarks(img, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+        
+        # Detect gesture
+        gesture_name, confidence, lmList = self.detect_gesture(hand_landmarks, w, h)
+        
+        # Only process if confidence is above threshold
+        if confidence < self._gesture_threshold:
+            self.current_gesture = "None"
+            self.gesture_confidence = 0.0
+            return "None", 0.0
+        
+        # Store current gesture info
+        self.current_gesture = gesture_name
+        self.gesture_confidence = confidence
+        
+        # Process gestures
+        if gesture_name == "Four Fingers":
+            # Move cursor
+            cursor_pos = self.process_cursor_movement(lmList, wScr, hScr, w, h)
             
-            return gesture_name, confidence
+            if self._show_visual_feedback:
+                cv2.circle(img, cursor_pos, 8, (0, 255, 0), -1)
+                cv2.putText(img, 'CURSOR', (cursor_pos[0] + 15, cursor_pos[1] - 15), 
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+        
+        elif gesture_name == "Pinch":
+            # Left click
+            self.process_left_click(lmList, img)
+        
+        elif gesture_name == "Pinky":
+            # Right click  
+            self.process_right_click(lmList, img)
+        
+        elif gesture_name in ["One Finger", "Two Fingers", "Index Pinky"]:
+            # Bookmarks (only 3)
+            self.process_bookmarks(gesture_name, img, lmList)
         
-        return "None", 0.0
+        return gesture_name, confidence
     
     def cleanup(self):
         """Clean up MediaPipe resources safely"""
@@ -4,137 +4,296 @@ Handles application settings and persistence
 """
 
 import json
+import logging
 import os
+import threading
+from collections import ChainMap
+from types import MappingProxyType
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+# Benchmark result written by test.py; its recommendations are applied on load
+DEVICE_PROFILE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "gesture_cursor",
+                                   "device_profile.json")
+DEVICE_PROFILE_KEYS = ("model_complexity", "inference_width")
+
+def read_json(path):
+    """Parse a JSON file, using orjson when available"""
+    if orjson:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+def write_json(path, data, durable=False):
+    """Serialize data to a JSON file, using orjson when available"""
+    # Serialize up front so the file gets a single write() call
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=4).encode("utf-8")
+    
+    with open(path, "wb") as f:
+        f.write(payload)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+
+def clamp(low, high):
+    """Build a validator that clamps a numeric value to [low, high]"""
+    return lambda value: max(low, min(high, value))
+
+def validate_model_complexity(value):
+    """MediaPipe hands only ships a lite (0) and a full (1) model"""
+    return value if value in (0, 1) else 0
+
+def validate_resolution(resolution):
+    """Validate camera resolution"""
+    if not isinstance(resolution, list) or len(resolution) != 2:
+        return [640, 480]
+    return [max(320, min(1920, resolution[0])), max(240, min(1080, resolution[1]))]
+
+def validate_bookmarks(bookmarks):
+    """Validate bookmarks and ensure all entries are strings"""
+    # The GUI keeps 3 bookmarks, older files have 4; both are fine
+    if not isinstance(bookmarks, list) or not bookmarks:
+        return ["", "", "", ""]
+    return [bookmark if isinstance(bookmark, str) else "" for bookmark in bookmarks]
+
+DEFAULT_SETTINGS = {
+    "use_gpu": False,
+    "model_complexity": 0,  # 0 = lite (fast), 1 = full (more accurate, slower)
+    "bookmarks": ["", "", "", ""],
+    "cursor_sensitivity": 0.7,
+    "click_rate": 2.0,
+    "gesture_threshold": 0.8,
+    "stability_zone": 15,
+    "camera_resolution": [640, 480],
+    "inference_width": 480,  # Width of the frame handed to MediaPipe
+    "show_visual_feedback": True,
+    "window_theme": "modern",
+    "auto_start_camera": True,
+    "emergency_hotkey": "ctrl+alt+q"
+}
+
+def copy_defaults():
+    """Fresh copy of DEFAULT_SETTINGS; only the list values need their own copies"""
+    return {**DEFAULT_SETTINGS,
+            "bookmarks": list(DEFAULT_SETTINGS["bookmarks"]),
+            "camera_resolution": list(DEFAULT_SETTINGS["camera_resolution"])}
+
+# Numeric settings and their (low, high) ranges, the single source for both the
+# vectorized clamp in validate_settings and the per-key validators used by update()
+CLAMP_RANGES = {
+    "cursor_sensitivity": (0.1, 1.0),
+    "click_rate": (0.5, 10.0),
+    "gesture_threshold": (0.3, 1.0),
+    "stability_zone": (1, 100),
+    "inference_width": (160, 1280)
+}
+CLAMP_KEYS = tuple(CLAMP_RANGES)
+CLAMP_BOUNDS = np.array(list(CLAMP_RANGES.values()))
 
 class SettingsManager:
+    __slots__ = ("settings_file", "default_settings", "_settings", "_data_lock",
+                 "_save_lock", "_queue_lock", "_save_event", "_save_pending", "_save_thread")
+    
+    # Per-key validators: clamp numeric values to reasonable ranges
+    _VALIDATORS = {
+        **{key: clamp(low, high) for key, (low, high) in CLAMP_RANGES.items()},
+        "model_complexity": validate_model_complexity,
+        "camera_resolution": validate_resolution,
+        "bookmarks": validate_bookmarks
+    }
+    
     def __init__(self, settings_file="gesture_settings.json"):
         self.settings_file = settings_file
-        self.default_settings = {
-            "use_gpu": False,
-            "bookmarks": ["", "", "", ""],
-            "cursor_sensitivity": 0.7,
-            "click_rate": 2.0,
-            "gesture_threshold": 0.8,
-            "stability_zone": 15,
-            "camera_resolution": [640, 480],
-            "show_visual_feedback": True,
-            "window_theme": "modern",
-            "auto_start_camera": True,
-            "emergency_hotkey": "ctrl+alt+q"
-        }
-        self.settings = self.load_settings()
+        self.default_settings = DEFAULT_SETTINGS
+        self._settings = None  # Loaded on first access, see the settings property
+        
+        # Guards changes to the settings dict against the saver's snapshot
+        self._data_lock = threading.Lock()
+        
+        # Background saving state: _save_lock serializes the actual writes, the
+        # short-lived _queue_lock only guards _save_pending and the worker start
+        self._save_lock = threading.Lock()
+        self._queue_lock = threading.Lock()
+        self._save_event = threading.Event()
+        self._save_pending = False
+        self._save_thread = None
+    
+    @property
+    def settings(self):
+        """Current settings dict, read from disk on first access"""
+        if self._settings is None:
+            self._settings = self.load_settings()
+        return self._settings
+    
+    @settings.setter
+    def settings(self, value):
+        self._settings = value
     
     def load_settings(self):
         """Load settings from JSON file"""
         try:
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, "r") as f:
-                    loaded_settings = json.load(f)
-                    
-                    # Merge with defaults for missing keys
-                    settings = self.default_settings.copy()
-                    settings.update(loaded_settings)
-                    
-                    # Validate settings
-                    settings = self.validate_settings(settings)
-                    
-                    print("✅ Settings loaded successfully")
-                    return settings
+                loaded_settings = read_json(self.settings_file)
+                
+                # Merge with defaults for missing keys (a complete file needs no merge).
+                # validate_settings rebuilds the list values, so defaults aren't shared
+                if loaded_settings.keys() >= DEFAULT_SETTINGS.keys():
+                    settings = loaded_settings
+                else:
+                    settings = dict(ChainMap(loaded_settings, DEFAULT_SETTINGS))
+                
+                # Validate settings
+                settings = self.validate_settings(settings)
+                
+                log.debug("✅ Settings loaded successfully")
+                return self.apply_device_profile(settings)
         except Exception as e:
-            print(f"⚠️ Error loading settings: {e}")
+            log.warning("⚠️ Error loading settings: %s", e)
         
-        print("📝 Using default settings")
-        return self.default_settings.copy()
+        log.info("📝 Using default settings")
+        return self.apply_device_profile(copy_defaults())
     
-    def save_settings(self):
-        """Save current settings to JSON file"""
+    def apply_device_profile(self, settings):
+        """Take the hand model and inference width recommended by test.py's benchmark"""
+        # Only a profile newer than the settings file wins, so choices made in
+        # the GUI after running the benchmark are kept
         try:
-            # Create backup
-            if os.path.exists(self.settings_file):
-                backup_file = self.settings_file + ".backup"
-                os.rename(self.settings_file, backup_file)
-            
-            with open(self.settings_file, "w") as f:
-                json.dump(self.settings, f, indent=4)
-            
-            print("✅ Settings saved successfully")
-            return True
-            
+            profile_time = os.path.getmtime(DEVICE_PROFILE_FILE)
+        except OSError:
+            return settings
+        try:
+            if profile_time <= os.path.getmtime(self.settings_file):
+                return settings
+        except OSError:
+            pass
+        
+        try:
+            profile = read_json(DEVICE_PROFILE_FILE)
+            for key in DEVICE_PROFILE_KEYS:
+                if key in profile:
+                    settings[key] = self._VALIDATORS[key](profile[key])
+            log.info("📊 Applied %s device profile", profile.get("tier", "unknown"))
         except Exception as e:
-            print(f"❌ Error saving settings: {e}")
-            
-            # Restore backup if save failed
-            backup_file = self.settings_file + ".backup"
-            if os.path.exists(backup_file):
-                os.rename(backup_file, self.settings_file)
+            log.warning("⚠️ Error reading device profile: %s", e)
+        
+        return settings
+    
+    def save_settings(self):
+        """Queue a background save and return immediately (write errors are only logged)"""
+        # Callers debounce their own bursts of changes (see MainWindow.schedule_save);
+        # requests arriving during a write still collapse into one follow-up write.
+        # Never waits for a write in progress
+        with self._queue_lock:
+            self._save_pending = True
+            if self._save_thread is None or not self._save_thread.is_alive():
+                self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+                self._save_thread.start()
+        
+        self._save_event.set()
+    
+    def _save_worker(self):
+        """Write settings to disk whenever a save has been requested"""
+        while True:
+            self._save_event.wait()
+            self._save_event.clear()
             
-            return False
+            if self._save_pending:
+                self.flush_settings()
+    
+    def flush_settings(self, durable=False):
+        """Save current settings to JSON file now (atomically, via a temp file)"""
+        with self._queue_lock:
+            self._save_pending = False
+        
+        with self._save_lock:
+            tmp_file = self.settings_file + ".tmp"
+            try:
+                # Serialize a snapshot, not the dict the GUI thread may be changing
+                with self._data_lock:
+                    data = {key: list(value) if isinstance(value, list) else value
+                            for key, value in self.settings.items()}
+                write_json(tmp_file, data, durable)
+                os.replace(tmp_file, self.settings_file)
+                
+                log.debug("✅ Settings saved successfully")
+                return True
+                
+            except Exception as e:
+                log.error("❌ Error saving settings: %s", e)
+                return False
     
     def validate_settings(self, settings):
         """Validate and correct settings values"""
-        # Clamp numeric values to reasonable ranges
-        settings["cursor_sensitivity"] = max(0.1, min(1.0, settings["cursor_sensitivity"]))
-        settings["click_rate"] = max(0.5, min(10.0, settings["click_rate"]))
-        settings["gesture_threshold"] = max(0.3, min(1.0, settings["gesture_threshold"]))
-        settings["stability_zone"] = max(1, min(100, settings["stability_zone"]))
-        
-        # Validate camera resolution
-        if not isinstance(settings["camera_resolution"], list) or len(settings["camera_resolution"]) != 2:
-            settings["camera_resolution"] = [640, 480]
-        else:
-            settings["camera_resolution"][0] = max(320, min(1920, settings["camera_resolution"][0]))
-            settings["camera_resolution"][1] = max(240, min(1080, settings["camera_resolution"][1]))
+        # Clamp all numeric values in a single vectorized call
+        values = [settings[key] for key in CLAMP_KEYS]
+        clipped = np.clip(values, CLAMP_BOUNDS[:, 0], CLAMP_BOUNDS[:, 1]).tolist()
+        for key, value, clipped_value in zip(CLAMP_KEYS, values, clipped):
+            settings[key] = type(value)(clipped_value)
         
-        # Validate bookmarks
-        if not isinstance(settings["bookmarks"], list) or len(settings["bookmarks"]) != 4:
-            settings["bookmarks"] = ["", "", "", ""]
-        
-        # Ensure all bookmark entries are strings
-        for i in range(4):
-            if not isinstance(settings["bookmarks"][i], str):
-                settings["bookmarks"][i] = ""
+        for key, validator in self._VALIDATORS.items():
+            if key not in CLAMP_KEYS:
+                settings[key] = validator(settings[key])
         
         return settings
     
+    def snapshot(self):
+        """Read-only view of the current settings for bulk lookups"""
+        return MappingProxyType(self.settings)
+    
     def get(self, key, default=None):
         """Get a setting value"""
         return self.settings.get(key, default)
     
     def set(self, key, value):
         """Set a setting value"""
-        self.settings[key] = value
+        with self._data_lock:
+            self.settings[key] = value
     
     def update(self, new_settings):
-        """Update multiple settings"""
-        self.settings.update(new_settings)
-        self.settings = self.validate_settings(self.settings)
+        """Update multiple settings, validating only the changed keys"""
+        with self._data_lock:
+            for key, value in new_settings.items():
+                validator = self._VALIDATORS.get(key)
+                self.settings[key] = validator(value) if validator else value
     
     def reset_to_defaults(self):
         """Reset all settings to defaults"""
-        self.settings = self.default_settings.copy()
-        return self.save_settings()
+        # In place: the detector and camera controller hold this same dict
+        with self._data_lock:
+            self.settings.clear()
+            self.settings.update(copy_defaults())
+        return self.flush_settings()
     
     def export_settings(self, filepath):
         """Export settings to a file"""
         try:
-            with open(filepath, "w") as f:
-                json.dump(self.settings, f, indent=4)
+            write_json(filepath, self.settings)
             return True
         except Exception as e:
-            print(f"Error exporting settings: {e}")
+            log.error("Error exporting settings: %s", e)
             return False
     
     def import_settings(self, filepath):
         """Import settings from a file"""
         try:
-            with open(filepath, "r") as f:
-                imported_settings = json.load(f)
+            imported_settings = read_json(filepath)
             
-            # Merge with current settings
-            self.settings.update(imported_settings)
-            self.settings = self.validate_settings(self.settings)
+            # Merge into the current settings dict in place (components share it)
+            with self._data_lock:
+                self.settings.update(imported_settings)
+                self.validate_settings(self.settings)
             
-            return self.save_settings()
+            return self.flush_settings()
         except Exception as e:
-            print(f"Error importing settings: {e}")
+            log.error("Error importing settings: %s", e)
             return False
\ No newline at end of file
@@ -5,6 +5,30 @@ Run this after the main build to fix the Unicode issue
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import reflink
+    REFLINK_AVAILABLE = True
+except ImportError:
+    REFLINK_AVAILABLE = False
+
+def _fast_copy(src, dst):
+    """Copy a file via hardlink or reflink when possible, falling back to a full copy"""
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    
+    if REFLINK_AVAILABLE:
+        try:
+            reflink.reflink(src, dst)
+            return
+        except Exception:
+            pass
+    
+    shutil.copy2(src, dst)
 
 def create_batch_installer():
     """Create a simple batch file for easy installation"""
@@ -42,7 +66,7 @@ def create_distribution_package():
     # Copy executable
     exe_path = os.path.join(dist_dir, "GestureCursorController.exe")
     if os.path.exists(exe_path):
-        shutil.copy2(exe_path, package_dir)
+        _fast_copy(exe_path, os.path.join(package_dir, "GestureCursorController.exe"))
         print(f"📦 Copied executable to {package_dir}")
         
         # Get file size
@@ -60,12 +84,22 @@ def create_distribution_package():
     
     for src, dst in additional_files:
         if os.path.exists(src):
-            shutil.copy2(src, os.path.join(package_dir, dst))
+            _fast_copy(src, os.path.join(package_dir, dst))
             print(f"📄 Copied {dst}")
     
     print(f"✅ Distribution package created: {package_dir}/")
     return True
 
+def _remove_build_item(item):
+    """Remove a build file or directory if it exists"""
+    if os.path.exists(item):
+        if os.path.isdir(item):
+            shutil.rmtree(item)
+            print(f"🧹 Cleaned up directory: {item}")
+        else:
+            os.remove(item)
+            print(f"🧹 Cleaned up file: {item}")
+
 def cleanup_build_files():
     """Clean up temporary build files"""
     files_to_remove = [
@@ -74,14 +108,17 @@ def cleanup_build_files():
         "__pycache__"
     ]
     
-    for item in files_to_remove:
-        if os.path.exists(item):
-            if os.path.isdir(item):
-                shutil.rmtree(item)
-                print(f"🧹 Cleaned up directory: {item}")
-            else:
-                os.remove(item)
-                print(f"🧹 Cleaned up file: {item}")
+    # Removals are syscall-bound, so the large build/ tree overlaps with the rest
+    with ThreadPoolExecutor(max_workers=len(files_to_remove)) as executor:
+        list(executor.map(_remove_build_item, files_to_remove))
+
+def _scan_dir(directory):
+    """Map entry names to DirEntry objects for a directory (empty if missing)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries}
+    except FileNotFoundError:
+        return {}
 
 def verify_build():
     """Verify that the build was successful"""
@@ -92,15 +129,24 @@ def verify_build():
         "GestureCursorController_v1.0/Start_Gesture_Controller.bat"
     ]
     
+    # One directory listing per folder instead of a stat per file
+    listings = {}
+    
     all_good = True
     for file_path in required_files:
-        if os.path.exists(file_path):
-            size = os.path.getsize(file_path) / (1024 * 1024) if file_path.endswith('.exe') else 0
-            status = f"({size:.1f} MB)" if size > 0 else ""
-            print(f"✅ {file_path} {status}")
-        else:
+        directory, name = os.path.split(file_path)
+        if directory not in listings:
+            listings[directory] = _scan_dir(directory)
+        
+        entry = listings[directory].get(name)
+        if entry is None:
             print(f"❌ Missing: {file_path}")
             all_good = False
+            continue
+        
+        size = entry.stat().st_size / (1024 * 1024) if file_path.endswith('.exe') else 0
+        status = f"({size:.1f} MB)" if size > 0 else ""
+        print(f"✅ {file_path} {status}")
     
     return all_good
 
@@ -5,29 +5,43 @@ Clean, centered layout with all functionality organized in tabs
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+from tkinter import font as tkfont
+import datetime
 import threading
-import sys
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import MappingProxyType
 import os
-
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import platform
+import webbrowser
+import cv2
 
 from core.settings_manager import SettingsManager
 from core.gesture_detector import GestureDetector
 from core.camera_controller import CameraController
 from gui.training_window import TrainingWindow
 
-try:
-    import keyboard
-    KEYBOARD_AVAILABLE = True
-except ImportError:
-    KEYBOARD_AVAILABLE = False
-    print("⚠️ Keyboard library not available. Emergency hotkey disabled.")
+# The keyboard package (global hotkey) is imported lazily by _install_global_hotkey
+keyboard = None
+KEYBOARD_AVAILABLE = False
+
+# Poll interval (ms) for camera -> GUI performance updates
+PERF_REFRESH_MS = 100
+
+# Poll interval (ms) for results handed over by worker threads
+RESULT_POLL_MS = 50
+
+# Delay (ms) after the last settings change before it is written to disk
+SAVE_DEBOUNCE_MS = 250
+
+# Delay (ms) after the last hand model switch before the detector is rebuilt
+MODEL_DEBOUNCE_MS = 500
 
 class CompactStyle:
     """Clean, compact styling"""
     
-    COLORS = {
+    COLORS = MappingProxyType({
         'bg_main': '#f0f0f0',           # Light gray background
         'bg_card': '#ffffff',           # White cards
         'bg_header': '#2c3e50',         # Dark blue header
@@ -45,15 +59,78 @@ class CompactStyle:
         
         'border': '#bdc3c7',            # Light border
         'border_focus': '#3498db'       # Blue focus border
-    }
+    })
     
-    FONTS = {
+    FONTS = MappingProxyType({
         'title': ('Arial', 16, 'bold'),
         'heading': ('Arial', 12, 'bold'),
         'body': ('Arial', 10),
         'body_bold': ('Arial', 10, 'bold'),
         'small': ('Arial', 9)
-    }
+    })
+
+# Module-level aliases: one global load per lookup instead of a class attribute chain
+COLORS = CompactStyle.COLORS
+FONTS = CompactStyle.FONTS
+
+# Button color -> darker hover color
+_DARKEN_MAP = {
+    COLORS['bg_button']: COLORS['bg_button_hover'],
+    COLORS['bg_success']: '#229954',
+    COLORS['bg_danger']: '#c0392b',
+    COLORS['bg_warning']: '#d68910',
+    COLORS['bg_info']: '#7d3c98'
+}
+
+# Font family with color emoji glyphs (Windows); other platforms fall back to their default
+EMOJI_FONT = 'Segoe UI Emoji'
+
+# Named ttk label styles: style -> (background, foreground, font) keys into CompactStyle
+LABEL_STYLES = {
+    'HeaderTitle': ('bg_header', 'text_white', 'title'),
+    'CardHeader': ('bg_header', 'text_white', 'heading'),
+    'StatusBar': ('bg_header', 'text_white', 'small'),
+    'PageTitle': ('bg_main', 'text_primary', 'title'),
+    'PageDesc': ('bg_main', 'text_secondary', 'body'),
+    'Tile': ('bg_main', 'text_primary', 'body'),
+    'TileTitle': ('bg_main', 'text_primary', 'body_bold'),
+    'TileCaption': ('bg_main', 'text_secondary', 'small'),
+    'TileValue': ('bg_main', 'text_accent', 'body_bold'),
+    'Card': ('bg_card', 'text_primary', 'body'),
+    'CardTitle': ('bg_card', 'text_primary', 'body_bold'),
+    'CardHint': ('bg_card', 'text_secondary', 'small'),
+    'CardValue': ('bg_card', 'text_accent', 'body_bold'),
+    'CardWarning': ('bg_card', 'bg_warning', 'body')
+}
+
+# Bindtag shared by all create_button buttons, so hover costs one class binding
+HOVER_BINDTAG = 'HoverButton'
+
+def _on_button_enter(event):
+    """Darken a create_button button under the pointer"""
+    # Tk only draws activebackground while the button is pressed on Windows,
+    # so hover needs its own binding there
+    button = event.widget
+    if str(button.cget('state')) == 'disabled':
+        return
+    bg = button.cget('bg')
+    hover_bg = _DARKEN_MAP.get(bg, bg)
+    if hover_bg != bg:
+        button.hover_restore_bg = bg
+        button.config(bg=hover_bg)
+
+def _on_button_leave(event):
+    """Restore the color a hovered button had, unless it was restyled meanwhile"""
+    button = event.widget
+    restore_bg = getattr(button, 'hover_restore_bg', None)
+    if restore_bg and button.cget('bg') == _DARKEN_MAP[restore_bg]:
+        button.config(bg=restore_bg)
+    button.hover_restore_bg = None
+
+def set_if_changed(var, value):
+    """Set a Tk variable only if its value differs, skipping the trace and redraw"""
+    if var.get() != value:
+        var.set(value)
 
 class MainWindow:
     def __init__(self, root):
@@ -71,9 +148,41 @@ class MainWindow:
                 bookmarks.append("")
             self.settings_manager.set("bookmarks", bookmarks)
         
+        # Settings snapshot used while building widgets (plain dict lookups)
+        self._settings = self.settings_manager.snapshot()
+        
+        # Bookmarks as last successfully written by save/import/reset
+        self._saved_bookmarks = list(self.settings_manager.get("bookmarks"))
+        
         self.gesture_detector = None
         self.camera_controller = None
         
+        # Latest (fps, gesture, confidence) from the camera thread; Tk is only
+        # touched from the main thread, which drains this queue
+        self.update_queue = queue.Queue(maxsize=1)
+        
+        # (callback, args) from worker threads, run on the Tk thread by _poll_results.
+        # Workers never call root.after themselves: that blocks on the Tk thread,
+        # which deadlocks while on_closing waits for them
+        self._results = queue.Queue()
+        
+        # Incremented per background component build; only the newest one is kept
+        self._components_gen = 0
+        
+        # Pending after() id for the debounced settings write
+        self._pending_save_id = None
+        
+        # Model complexity the current detector was built with, and the pending rebuild
+        self._applied_model = self.settings_manager.get("model_complexity")
+        self._pending_model_id = None
+        
+        # Single worker for user-triggered file I/O (save/export/import) so the
+        # Tk loop keeps running while the disk is busy
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        
+        # Slider variables by setting key, filled by create_settings_slider
+        self._setting_vars = {}
+        
         # Application state
         self.is_running = False
         self.training_window = None
@@ -83,6 +192,7 @@ class MainWindow:
         self.setup_emergency_stop()
         
         # Initialize components after GUI
+        self._poll_results()
         self.initialize_components()
         
         # Bind close event
@@ -97,26 +207,74 @@ class MainWindow:
         # Fixed size - no resizing
         window_width = 600
         window_height = 700
-        self.root.geometry(f"{window_width}x{window_height}")
         self.root.resizable(False, False)  # Fixed size
-        self.root.configure(bg=CompactStyle.COLORS['bg_main'])
+        self.root.configure(bg=COLORS['bg_main'])
         
-        # Center window on screen
-        self.root.update_idletasks()
+        # Center window on screen (screen size is known before the window is mapped)
         x = (self.root.winfo_screenwidth() // 2) - (window_width // 2)
         y = (self.root.winfo_screenheight() // 2) - (window_height // 2)
         self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
     
     def initialize_components(self):
-        """Initialize gesture detector and camera controller"""
+        """Initialize gesture detector and camera controller without blocking the GUI"""
+        # Loading the MediaPipe model takes a while, keep Start disabled until it's done
+        self.start_button.config(state='disabled', bg=COLORS['text_secondary'])
+        self.set_status("Loading hand tracking model...")
+        self._components_gen += 1
+        threading.Thread(target=self._init_components_bg, args=(self._components_gen,), daemon=True).start()
+    
+    def _build_components(self):
+        """Create a gesture detector and camera controller pair"""
         try:
-            self.gesture_detector = GestureDetector(self.settings_manager.settings)
-            self.camera_controller = CameraController(self.settings_manager.settings, self.gesture_detector)
+            gesture_detector = GestureDetector(self.settings_manager.settings)
+            camera_controller = CameraController(self.settings_manager.settings, gesture_detector,
+                                                 self.update_queue)
+            return gesture_detector, camera_controller
         except Exception as e:
             print(f"Error initializing components: {e}")
+            return None, None
+    
+    def _init_components_bg(self, generation):
+        """Build components on a worker thread and hand them to the Tk thread"""
+        gesture_detector, camera_controller = self._build_components()
+        self._results.put((self._on_components_ready, (generation, gesture_detector, camera_controller)))
+    
+    def _poll_results(self):
+        """Run callbacks queued by worker threads (Tk thread)"""
+        while True:
+            try:
+                callback, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Error handling background result: {e}")
+        
+        self.root.after(RESULT_POLL_MS, self._poll_results)
+    
+    def _on_components_ready(self, generation, gesture_detector, camera_controller):
+        """Install background-built components (runs on the Tk thread)"""
+        if generation != self._components_gen:
+            # A newer rebuild has started since; this one is already stale
+            if gesture_detector:
+                gesture_detector.cleanup()
+            return
+        
+        self.gesture_detector = gesture_detector
+        self.camera_controller = camera_controller
+        
+        if not self.is_running:
+            self.start_button.config(state='normal', bg=COLORS['bg_success'])
+            self.set_status("Ready to start" if camera_controller else "Failed to load hand tracking")
     
     def setup_compact_gui(self):
         """Setup compact GUI with all functionality organized in tabs"""
+        # Shared widget styles
+        self.setup_styles()
+        self.root.bind_class(HOVER_BINDTAG, '<Enter>', _on_button_enter)
+        self.root.bind_class(HOVER_BINDTAG, '<Leave>', _on_button_leave)
+        
         # Header
         self.setup_header()
         
@@ -126,50 +284,83 @@ class MainWindow:
         # Status bar
         self.setup_status_bar()
     
+    def setup_styles(self):
+        """Configure ttk styles once so widgets only need a style name"""
+        # Emoji-only labels use a font that has the glyphs, so Tk doesn't
+        # walk its font-fallback chain for every emoji it draws
+        self._emoji_font_sm = tkfont.Font(family=EMOJI_FONT, size=14)
+        self._emoji_font_lg = tkfont.Font(family=EMOJI_FONT, size=20)
+        
+        style = ttk.Style()
+        style.configure('TNotebook.Tab', padding=[12, 8], font=FONTS['body'])
+        
+        # Performance tiles: caption in the frame border, value inside
+        style.configure('Tile.TLabelframe', background=COLORS['bg_main'])
+        style.configure('Tile.TLabelframe.Label', background=COLORS['bg_main'],
+                        foreground=COLORS['text_secondary'], font=FONTS['small'])
+        
+        for name, (bg, fg, font) in LABEL_STYLES.items():
+            style.configure(f'{name}.TLabel', background=COLORS[bg],
+                            foreground=COLORS[fg], font=FONTS[font])
+    
     def setup_header(self):
         """Setup header"""
-        header_frame = tk.Frame(self.root, bg=CompactStyle.COLORS['bg_header'], height=60)
+        header_frame = tk.Frame(self.root, bg=COLORS['bg_header'], height=60)
         header_frame.pack(fill='x')
         header_frame.pack_propagate(False)
         
         # Title with icon
-        title_frame = tk.Frame(header_frame, bg=CompactStyle.COLORS['bg_header'])
+        title_frame = tk.Frame(header_frame, bg=COLORS['bg_header'])
         title_frame.pack(expand=True)
         
         icon_label = tk.Label(title_frame, text="🖱️", 
-                             bg=CompactStyle.COLORS['bg_header'],
-                             font=('Arial', 20))
+                             bg=COLORS['bg_header'],
+                             font=self._emoji_font_lg)
         icon_label.pack(side='left', padx=(0, 10), pady=15)
         
-        title_label = tk.Label(title_frame, text="Gesture Cursor Controller",
-                              bg=CompactStyle.COLORS['bg_header'],
-                              fg=CompactStyle.COLORS['text_white'],
-                              font=CompactStyle.FONTS['title'])
+        title_label = ttk.Label(title_frame, text="Gesture Cursor Controller",
+                              style='HeaderTitle.TLabel')
         title_label.pack(side='left', pady=15)
     
     def setup_notebook(self):
         """Setup tabbed interface with all functionality"""
         # Create notebook frame
-        notebook_frame = tk.Frame(self.root, bg=CompactStyle.COLORS['bg_main'])
+        notebook_frame = tk.Frame(self.root, bg=COLORS['bg_main'])
         notebook_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Create notebook
         self.notebook = ttk.Notebook(notebook_frame)
         self.notebook.pack(fill='both', expand=True)
         
-        # Configure notebook style
-        style = ttk.Style()
-        style.configure('TNotebook.Tab', padding=[12, 8], font=CompactStyle.FONTS['body'])
-        
-        # Create tabs
+        # Create tabs - only the Control tab is built now, the others on first visit
         self.setup_main_tab()
-        self.setup_settings_tab()
-        self.setup_bookmarks_tab()
-        self.setup_advanced_tab()
+        
+        # Tab id -> builder for pages that haven't been shown yet
+        self._tab_builders = {}
+        self._tab_frames = {}
+        for name, text, builder in (('settings', "   Settings   ", self.setup_settings_tab),
+                                    ('bookmarks', "   Bookmarks   ", self.setup_bookmarks_tab),
+                                    ('advanced', "   Advanced   ", self.setup_advanced_tab)):
+            frame = tk.Frame(self.notebook, bg=COLORS['bg_main'])
+            self.notebook.add(frame, text=text)
+            self._tab_frames[name] = frame
+            self._tab_builders[str(frame)] = partial(builder, frame)
+        
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+    
+    def on_tab_changed(self, event):
+        """Build a tab's widgets the first time it is selected"""
+        builder = self._tab_builders.pop(self.notebook.select(), None)
+        if builder:
+            builder()
+    
+    def is_tab_built(self, name):
+        """Whether a lazily built tab has been shown (and so has widgets)"""
+        return str(self._tab_frames[name]) not in self._tab_builders
     
     def setup_main_tab(self):
         """Setup main control tab"""
-        main_frame = tk.Frame(self.notebook, bg=CompactStyle.COLORS['bg_main'])
+        main_frame = tk.Frame(self.notebook, bg=COLORS['bg_main'])
         self.notebook.add(main_frame, text="   Control   ")
         
         # Status indicators
@@ -181,19 +372,10 @@ class MainWindow:
         # Gesture guide
         self.setup_gesture_section_tab(main_frame)
     
-    def setup_settings_tab(self):
+    def setup_settings_tab(self, settings_frame):
         """Setup settings tab with all controls"""
-        settings_frame = tk.Frame(self.notebook, bg=CompactStyle.COLORS['bg_main'])
-        self.notebook.add(settings_frame, text="   Settings   ")
-        
         # Create scrollable frame for settings
-        canvas = tk.Canvas(settings_frame, bg=CompactStyle.COLORS['bg_main'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(settings_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=CompactStyle.COLORS['bg_main'])
-        
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollable_frame = self._make_scroll_region(settings_frame)
         
         # Processing mode
         self.setup_processing_section(scrollable_frame)
@@ -206,59 +388,31 @@ class MainWindow:
         
         # Visual settings
         self.setup_visual_section(scrollable_frame)
-        
-        # Pack scrollable components
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
     
-    def setup_bookmarks_tab(self):
+    def setup_bookmarks_tab(self, bookmarks_frame):
         """Setup bookmarks tab"""
-        bookmarks_frame = tk.Frame(self.notebook, bg=CompactStyle.COLORS['bg_main'])
-        self.notebook.add(bookmarks_frame, text="   Bookmarks   ")
-        
         # Header
-        header_frame = tk.Frame(bookmarks_frame, bg=CompactStyle.COLORS['bg_main'])
+        header_frame = tk.Frame(bookmarks_frame, bg=COLORS['bg_main'])
         header_frame.pack(fill='x', padx=10, pady=(10, 5))
         
-        title_label = tk.Label(header_frame, text="🔖 Bookmark Configuration",
-                              bg=CompactStyle.COLORS['bg_main'], fg=CompactStyle.COLORS['text_primary'],
-                              font=CompactStyle.FONTS['title'])
+        title_label = ttk.Label(header_frame, text="🔖 Bookmark Configuration",
+                              style='PageTitle.TLabel')
         title_label.pack(anchor='w')
         
-        desc_label = tk.Label(header_frame, text="Configure up to 3 websites to open with finger gestures",
-                             bg=CompactStyle.COLORS['bg_main'], fg=CompactStyle.COLORS['text_secondary'],
-                             font=CompactStyle.FONTS['body'])
+        desc_label = ttk.Label(header_frame, text="Configure up to 3 websites to open with finger gestures",
+                             style='PageDesc.TLabel')
         desc_label.pack(anchor='w', pady=(2, 0))
         
         # Create scrollable frame for bookmarks
-        canvas = tk.Canvas(bookmarks_frame, bg=CompactStyle.COLORS['bg_main'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(bookmarks_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=CompactStyle.COLORS['bg_main'])
-        
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollable_frame = self._make_scroll_region(bookmarks_frame)
         
         # Bookmarks
         self.setup_bookmarks_section_tab(scrollable_frame)
-        
-        # Pack scrollable components
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
     
-    def setup_advanced_tab(self):
+    def setup_advanced_tab(self, advanced_frame):
         """Setup advanced settings tab"""
-        advanced_frame = tk.Frame(self.notebook, bg=CompactStyle.COLORS['bg_main'])
-        self.notebook.add(advanced_frame, text="   Advanced   ")
-        
         # Create scrollable frame for advanced settings
-        canvas = tk.Canvas(advanced_frame, bg=CompactStyle.COLORS['bg_main'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(advanced_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=CompactStyle.COLORS['bg_main'])
-        
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollable_frame = self._make_scroll_region(advanced_frame)
         
         # Backup and restore
         self.setup_backup_section(scrollable_frame)
@@ -268,83 +422,115 @@ class MainWindow:
         
         # Training section
         self.setup_training_section(scrollable_frame)
+    
+    def _make_scroll_region(self, parent):
+        """Create a vertically scrollable area in parent and return its inner frame"""
+        canvas = tk.Canvas(parent, bg=COLORS['bg_main'], highlightthickness=0)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=COLORS['bg_main'])
+        
+        # Recompute the scroll region once per idle pass, not once per added widget
+        pending = []
+        
+        def update_scrollregion():
+            pending.clear()
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        def on_configure(event):
+            if not pending:
+                pending.append(canvas.after_idle(update_scrollregion))
+        
+        scrollable_frame.bind("<Configure>", on_configure)
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
         
         # Pack scrollable components
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        
+        # Wheel events go to the focus widget (Windows) or the widget under the
+        # pointer, never the canvas itself, so bind globally while the pointer is
+        # over this canvas. X11 reports the wheel as Button-4/5
+        def on_wheel(event):
+            if event.num == 4:
+                units = -1
+            elif event.num == 5:
+                units = 1
+            else:
+                # Windows sends multiples of 120, macOS small deltas
+                units = int(-event.delta / 120) or (-1 if event.delta > 0 else 1)
+            canvas.yview_scroll(units, 'units')
+        
+        def on_enter(event):
+            for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+                canvas.bind_all(sequence, on_wheel)
+        
+        def on_leave(event):
+            # Moving onto the inner frame also leaves the canvas; keep scrolling then
+            if event.detail == 'NotifyInferior':
+                return
+            for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+                canvas.unbind_all(sequence)
+        
+        canvas.bind('<Enter>', on_enter)
+        canvas.bind('<Leave>', on_leave)
+        
+        return scrollable_frame
     
     def setup_status_section_tab(self, parent):
         """Setup status indicators in main tab"""
         status_frame = self.create_card_tab(parent, "📊 Performance Monitor")
         
         # Status indicators in a grid
-        indicators_frame = tk.Frame(status_frame, bg=CompactStyle.COLORS['bg_card'])
+        indicators_frame = tk.Frame(status_frame, bg=COLORS['bg_card'])
         indicators_frame.pack(fill='x', padx=15, pady=10)
         
-        # FPS
-        fps_frame = tk.Frame(indicators_frame, bg=CompactStyle.COLORS['bg_main'], relief='solid', bd=1)
-        fps_frame.pack(side='left', fill='x', expand=True, padx=(0, 5), pady=2)
-        
-        tk.Label(fps_frame, text="FPS", bg=CompactStyle.COLORS['bg_main'],
-                fg=CompactStyle.COLORS['text_secondary'], font=CompactStyle.FONTS['small']).pack(pady=(5, 0))
-        
-        self.fps_var = tk.StringVar(value="--")
-        tk.Label(fps_frame, textvariable=self.fps_var, bg=CompactStyle.COLORS['bg_main'],
-                fg=CompactStyle.COLORS['text_accent'], font=CompactStyle.FONTS['body_bold']).pack(pady=(0, 5))
-        
-        # Gesture
-        gesture_frame = tk.Frame(indicators_frame, bg=CompactStyle.COLORS['bg_main'], relief='solid', bd=1)
-        gesture_frame.pack(side='left', fill='x', expand=True, padx=5, pady=2)
-        
-        tk.Label(gesture_frame, text="Gesture", bg=CompactStyle.COLORS['bg_main'],
-                fg=CompactStyle.COLORS['text_secondary'], font=CompactStyle.FONTS['small']).pack(pady=(5, 0))
-        
-        self.gesture_var = tk.StringVar(value="None")
-        tk.Label(gesture_frame, textvariable=self.gesture_var, bg=CompactStyle.COLORS['bg_main'],
-                fg=CompactStyle.COLORS['text_accent'], font=CompactStyle.FONTS['body_bold']).pack(pady=(0, 5))
-        
-        # Confidence
-        confidence_frame = tk.Frame(indicators_frame, bg=CompactStyle.COLORS['bg_main'], relief='solid', bd=1)
-        confidence_frame.pack(side='right', fill='x', expand=True, padx=(5, 0), pady=2)
-        
-        tk.Label(confidence_frame, text="Confidence", bg=CompactStyle.COLORS['bg_main'],
-                fg=CompactStyle.COLORS['text_secondary'], font=CompactStyle.FONTS['small']).pack(pady=(5, 0))
-        
-        self.confidence_var = tk.StringVar(value="--%")
-        tk.Label(confidence_frame, textvariable=self.confidence_var, bg=CompactStyle.COLORS['bg_main'],
-                fg=CompactStyle.COLORS['text_accent'], font=CompactStyle.FONTS['body_bold']).pack(pady=(0, 5))
+        # FPS, gesture and confidence tiles; their labels are configured directly
+        # by _poll_queue (no StringVar traces for these single-reader values)
+        indicators = [("FPS", "fps", "--", (0, 5)),
+                      ("Gesture", "gesture", "None", (5, 5)),
+                      ("Confidence", "confidence", "--%", (5, 0))]
+        
+        self._stat_labels = {}
+        for column, (caption, key, initial, padx) in enumerate(indicators):
+            tile = ttk.Labelframe(indicators_frame, text=caption, style='Tile.TLabelframe')
+            tile.grid(row=0, column=column, sticky='ew', padx=padx, pady=2)
+            indicators_frame.grid_columnconfigure(column, weight=1)
+            
+            label = ttk.Label(tile, text=initial, style='TileValue.TLabel', anchor='center')
+            label.pack(fill='x', pady=(0, 5))
+            self._stat_labels[key] = label
     
     def setup_control_section_tab(self, parent):
         """Setup control buttons in main tab"""
         control_frame = self.create_card_tab(parent, "⚡ Quick Controls")
         
         # Control buttons
-        button_frame = tk.Frame(control_frame, bg=CompactStyle.COLORS['bg_card'])
+        button_frame = tk.Frame(control_frame, bg=COLORS['bg_card'])
         button_frame.pack(fill='x', padx=15, pady=15)
         
         self.start_button = self.create_button(button_frame, "🚀 Start Cursor Control", self.start_control,
-                                              bg=CompactStyle.COLORS['bg_success'])
+                                              bg=COLORS['bg_success'])
         self.start_button.pack(side='left', padx=(0, 10))
         
         self.stop_button = self.create_button(button_frame, "⏹️ Stop Control", self.stop_control,
-                                             bg=CompactStyle.COLORS['bg_danger'], state='disabled')
+                                             bg=COLORS['bg_danger'], state='disabled')
         self.stop_button.pack(side='left', padx=(0, 10))
         
         self.training_button = self.create_button(button_frame, "🎓 Training Mode", self.start_training,
-                                                 bg=CompactStyle.COLORS['bg_info'])
+                                                 bg=COLORS['bg_info'])
         self.training_button.pack(side='right')
         
         # Emergency note
-        emergency_label = tk.Label(control_frame, text="🆘 Emergency Stop: Press Ctrl+Alt+Q anytime",
-                                  bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['bg_warning'],
-                                  font=CompactStyle.FONTS['body'])
+        emergency_label = ttk.Label(control_frame, text="🆘 Emergency Stop: Press Ctrl+Alt+Q anytime",
+                                  style='CardWarning.TLabel')
         emergency_label.pack(pady=(0, 15))
     
     def setup_gesture_section_tab(self, parent):
         """Setup gesture guide in main tab"""
         gesture_frame = self.create_card_tab(parent, "🤚 Gesture Guide")
         
-        gestures_container = tk.Frame(gesture_frame, bg=CompactStyle.COLORS['bg_card'])
+        gestures_container = tk.Frame(gesture_frame, bg=COLORS['bg_card'])
         gestures_container.pack(fill='x', padx=15, pady=10)
         
         # Simple gesture list - 6 gestures in 2 columns
@@ -357,80 +543,71 @@ class MainWindow:
             ("🤘", "Index + Pinky", "Bookmark 3")
         ]
         
+        # Configure grid weights
+        gestures_container.grid_columnconfigure(0, weight=1)
+        gestures_container.grid_columnconfigure(1, weight=1)
+        
         for i, (emoji, gesture, action) in enumerate(gestures):
             row = i // 2
             col = i % 2
             
-            gesture_item = tk.Frame(gestures_container, bg=CompactStyle.COLORS['bg_main'], 
-                                   relief='solid', bd=1)
+            # One frame per item: emoji spans both rows, name and action stacked beside it
+            gesture_item = tk.Frame(gestures_container, bg=COLORS['bg_main'], 
+                                   relief='solid', bd=1, padx=8, pady=6)
             gesture_item.grid(row=row, column=col, sticky='ew', padx=2, pady=2)
             
-            # Configure grid weights
-            gestures_container.grid_columnconfigure(0, weight=1)
-            gestures_container.grid_columnconfigure(1, weight=1)
-            
-            item_content = tk.Frame(gesture_item, bg=CompactStyle.COLORS['bg_main'])
-            item_content.pack(fill='x', padx=8, pady=6)
-            
-            emoji_label = tk.Label(item_content, text=emoji, bg=CompactStyle.COLORS['bg_main'],
-                                  font=('Arial', 14))
-            emoji_label.pack(side='left', padx=(0, 8))
-            
-            text_frame = tk.Frame(item_content, bg=CompactStyle.COLORS['bg_main'])
-            text_frame.pack(side='left', fill='x', expand=True)
+            emoji_label = tk.Label(gesture_item, text=emoji, bg=COLORS['bg_main'],
+                                  font=self._emoji_font_sm)
+            emoji_label.grid(row=0, column=0, rowspan=2, padx=(0, 8))
             
-            gesture_label = tk.Label(text_frame, text=gesture, bg=CompactStyle.COLORS['bg_main'],
-                                    fg=CompactStyle.COLORS['text_primary'], font=CompactStyle.FONTS['body_bold'])
-            gesture_label.pack(anchor='w')
+            gesture_label = ttk.Label(gesture_item, text=gesture, style='TileTitle.TLabel')
+            gesture_label.grid(row=0, column=1, sticky='w')
             
-            action_label = tk.Label(text_frame, text=action, bg=CompactStyle.COLORS['bg_main'],
-                                   fg=CompactStyle.COLORS['text_secondary'], font=CompactStyle.FONTS['small'])
-            action_label.pack(anchor='w')
+            action_label = ttk.Label(gesture_item, text=action, style='TileCaption.TLabel')
+            action_label.grid(row=1, column=1, sticky='w')
     
     def setup_processing_section(self, parent):
         """Setup processing mode section"""
         processing_frame = self.create_card_tab(parent, "🚀 Processing Mode")
         
-        mode_frame = tk.Frame(processing_frame, bg=CompactStyle.COLORS['bg_card'])
+        mode_frame = tk.Frame(processing_frame, bg=COLORS['bg_card'])
         mode_frame.pack(fill='x', padx=15, pady=15)
         
-        self.gpu_var = tk.BooleanVar(value=self.settings_manager.get("use_gpu"))
+        self.model_var = tk.IntVar(value=self._settings["model_complexity"])
         
-        # GPU option
-        gpu_frame = tk.Frame(mode_frame, bg=CompactStyle.COLORS['bg_card'])
-        gpu_frame.pack(fill='x', pady=5)
+        # Lite model option
+        lite_frame = tk.Frame(mode_frame, bg=COLORS['bg_card'])
+        lite_frame.pack(fill='x', pady=5)
         
-        gpu_radio = tk.Radiobutton(gpu_frame, text="🔥 GPU Accelerated (CUDA)",
-                                  variable=self.gpu_var, value=True, command=self.update_gpu_setting,
-                                  bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_primary'],
-                                  font=CompactStyle.FONTS['body'], anchor='w')
-        gpu_radio.pack(fill='x')
+        lite_radio = tk.Radiobutton(lite_frame, text="⚡ Lite Hand Model",
+                                   variable=self.model_var, value=0, command=self.update_model_setting,
+                                   bg=COLORS['bg_card'], fg=COLORS['text_primary'],
+                                   font=FONTS['body'], anchor='w')
+        lite_radio.pack(fill='x')
         
-        gpu_desc = tk.Label(gpu_frame, text="Faster processing, lower CPU usage, requires CUDA-compatible GPU",
-                           bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_secondary'],
-                           font=CompactStyle.FONTS['small'])
-        gpu_desc.pack(fill='x', padx=20, pady=(2, 0))
+        lite_desc = ttk.Label(lite_frame, text="Roughly twice as fast, lower CPU usage (recommended)",
+                            style='CardHint.TLabel')
+        lite_desc.pack(fill='x', padx=20, pady=(2, 0))
         
-        # CPU option
-        cpu_frame = tk.Frame(mode_frame, bg=CompactStyle.COLORS['bg_card'])
-        cpu_frame.pack(fill='x', pady=5)
+        # Full model option
+        full_frame = tk.Frame(mode_frame, bg=COLORS['bg_card'])
+        full_frame.pack(fill='x', pady=5)
         
-        cpu_radio = tk.Radiobutton(cpu_frame, text="💻 CPU Processing",
-                                  variable=self.gpu_var, value=False, command=self.update_gpu_setting,
-                                  bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_primary'],
-                                  font=CompactStyle.FONTS['body'], anchor='w')
-        cpu_radio.pack(fill='x')
+        full_radio = tk.Radiobutton(full_frame, text="🎯 Full Hand Model",
+                                   variable=self.model_var, value=1, command=self.update_model_setting,
+                                   bg=COLORS['bg_card'], fg=COLORS['text_primary'],
+                                   font=FONTS['body'], anchor='w')
+        full_radio.pack(fill='x')
         
-        cpu_desc = tk.Label(cpu_frame, text="Compatible with all systems, uses CPU for processing",
-                           bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_secondary'],
-                           font=CompactStyle.FONTS['small'])
-        cpu_desc.pack(fill='x', padx=20, pady=(2, 0))
+        full_desc = ttk.Label(full_frame, text="Slightly more accurate landmarks at a higher CPU cost",
+                            style='CardHint.TLabel')
+        full_desc.pack(fill='x', padx=20, pady=(2, 0))
     
     def setup_sensitivity_section(self, parent):
         """Setup sensitivity settings"""
         sensitivity_frame = self.create_card_tab(parent, "🎯 Cursor & Gesture Settings")
         
-        settings_container = tk.Frame(sensitivity_frame, bg=CompactStyle.COLORS['bg_card'])
+        settings_container = tk.Frame(sensitivity_frame, bg=COLORS['bg_card'])
         settings_container.pack(fill='x', padx=15, pady=15)
         
         # Cursor sensitivity
@@ -453,210 +630,199 @@ class MainWindow:
         """Setup performance settings"""
         performance_frame = self.create_card_tab(parent, "⚡ Performance Settings")
         
-        perf_container = tk.Frame(performance_frame, bg=CompactStyle.COLORS['bg_card'])
+        perf_container = tk.Frame(performance_frame, bg=COLORS['bg_card'])
         perf_container.pack(fill='x', padx=15, pady=15)
         
         # Camera resolution
-        tk.Label(perf_container, text="Camera Resolution:",
-                bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_primary'],
-                font=CompactStyle.FONTS['body_bold']).pack(anchor='w', pady=(0, 5))
+        ttk.Label(perf_container, text="Camera Resolution:",
+                style='CardTitle.TLabel').pack(anchor='w', pady=(0, 5))
         
-        self.resolution_var = tk.StringVar(
-            value=f"{self.settings_manager.get('camera_resolution')[0]}x{self.settings_manager.get('camera_resolution')[1]}")
+        width, height = self._settings["camera_resolution"]
+        self.resolution_var = tk.StringVar(value=f"{width}x{height}")
         
         resolutions = ["320x240", "640x480", "800x600", "1280x720"]
         for res in resolutions:
             res_radio = tk.Radiobutton(perf_container, text=res, variable=self.resolution_var, value=res,
-                                      command=self.update_resolution, bg=CompactStyle.COLORS['bg_card'],
-                                      fg=CompactStyle.COLORS['text_primary'], font=CompactStyle.FONTS['body'])
+                                      command=self.update_resolution, bg=COLORS['bg_card'],
+                                      fg=COLORS['text_primary'], font=FONTS['body'])
             res_radio.pack(anchor='w', pady=1)
     
     def setup_visual_section(self, parent):
         """Setup visual feedback settings"""
         visual_frame = self.create_card_tab(parent, "👁️ Visual Feedback")
         
-        visual_container = tk.Frame(visual_frame, bg=CompactStyle.COLORS['bg_card'])
+        visual_container = tk.Frame(visual_frame, bg=COLORS['bg_card'])
         visual_container.pack(fill='x', padx=15, pady=15)
         
-        self.visual_var = tk.BooleanVar(value=self.settings_manager.get("show_visual_feedback"))
+        self.visual_var = tk.BooleanVar(value=self._settings["show_visual_feedback"])
         
         visual_check = tk.Checkbutton(visual_container, text="Show gesture feedback on camera view",
                                      variable=self.visual_var, command=self.update_visual_feedback,
-                                     bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_primary'],
-                                     font=CompactStyle.FONTS['body'], anchor='w')
+                                     bg=COLORS['bg_card'], fg=COLORS['text_primary'],
+                                     font=FONTS['body'], anchor='w')
         visual_check.pack(fill='x')
         
-        desc_label = tk.Label(visual_container,
+        desc_label = ttk.Label(visual_container,
                              text="Displays gesture recognition results and instructions on camera feed",
-                             bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_secondary'],
-                             font=CompactStyle.FONTS['small'])
+                             style='CardHint.TLabel')
         desc_label.pack(fill='x', pady=(5, 0))
     
     def setup_bookmarks_section_tab(self, parent):
         """Setup bookmarks section in tab"""
-        self.bookmark_entries = []
+        self.bookmark_vars = []
+        bookmarks = self._settings["bookmarks"]
         
         for i in range(3):
             bookmark_frame = self.create_card_tab(parent, f"🔖 Bookmark {i+1}")
             
-            bookmark_container = tk.Frame(bookmark_frame, bg=CompactStyle.COLORS['bg_card'])
+            bookmark_container = tk.Frame(bookmark_frame, bg=COLORS['bg_card'])
             bookmark_container.pack(fill='x', padx=15, pady=15)
             
             # Gesture info
             gestures = ["👆 1 Finger (Index)", "✌️ 2 Fingers (Index+Middle)", "🤘 Index + Pinky"]
-            gesture_label = tk.Label(bookmark_container, text=f"Gesture: {gestures[i]}",
-                                    bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_accent'],
-                                    font=CompactStyle.FONTS['body_bold'])
+            gesture_label = ttk.Label(bookmark_container, text=f"Gesture: {gestures[i]}",
+                                    style='CardValue.TLabel')
             gesture_label.pack(anchor='w', pady=(0, 8))
             
             # URL label
-            url_label = tk.Label(bookmark_container, text="Website URL:",
-                                bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_primary'],
-                                font=CompactStyle.FONTS['body'])
+            url_label = ttk.Label(bookmark_container, text="Website URL:",
+                                style='Card.TLabel')
             url_label.pack(anchor='w', pady=(0, 5))
             
             # Entry and button frame
-            entry_frame = tk.Frame(bookmark_container, bg=CompactStyle.COLORS['bg_card'])
+            entry_frame = tk.Frame(bookmark_container, bg=COLORS['bg_card'])
             entry_frame.pack(fill='x')
             
             # URL entry
-            entry = tk.Entry(entry_frame, font=CompactStyle.FONTS['body'], relief='solid', bd=1)
+            url_var = tk.StringVar(value=bookmarks[i])
+            entry = tk.Entry(entry_frame, textvariable=url_var, font=FONTS['body'], relief='solid', bd=1)
             entry.pack(side='left', fill='x', expand=True, padx=(0, 10))
-            entry.insert(0, self.settings_manager.get("bookmarks")[i])
-            self.bookmark_entries.append(entry)
+            self.bookmark_vars.append(url_var)
             
             # Buttons
             test_button = self.create_button(entry_frame, "🧪 Test", 
-                                           lambda idx=i: self.test_bookmark(idx),
-                                           bg=CompactStyle.COLORS['bg_info'], size='small')
+                                           partial(self.test_bookmark, i),
+                                           bg=COLORS['bg_info'], size='small')
             test_button.pack(side='right', padx=(0, 5))
             
             clear_button = self.create_button(entry_frame, "🗑️ Clear",
-                                            lambda idx=i: self.clear_bookmark(idx),
-                                            bg=CompactStyle.COLORS['bg_warning'], size='small')
+                                            partial(self.clear_bookmark, i),
+                                            bg=COLORS['bg_warning'], size='small')
             clear_button.pack(side='right')
         
         # Save button
-        save_frame = tk.Frame(parent, bg=CompactStyle.COLORS['bg_main'])
+        save_frame = tk.Frame(parent, bg=COLORS['bg_main'])
         save_frame.pack(fill='x', padx=10, pady=10)
         
         save_button = self.create_button(save_frame, "💾 Save All Bookmarks", self.save_bookmarks,
-                                        bg=CompactStyle.COLORS['bg_success'])
+                                        bg=COLORS['bg_success'])
         save_button.pack()
     
     def setup_backup_section(self, parent):
         """Setup backup and restore section"""
         backup_frame = self.create_card_tab(parent, "💾 Backup & Restore")
         
-        backup_container = tk.Frame(backup_frame, bg=CompactStyle.COLORS['bg_card'])
+        backup_container = tk.Frame(backup_frame, bg=COLORS['bg_card'])
         backup_container.pack(fill='x', padx=15, pady=15)
         
-        button_frame = tk.Frame(backup_container, bg=CompactStyle.COLORS['bg_card'])
+        button_frame = tk.Frame(backup_container, bg=COLORS['bg_card'])
         button_frame.pack(fill='x')
         
         export_button = self.create_button(button_frame, "📤 Export Settings", self.export_settings,
-                                          bg=CompactStyle.COLORS['bg_info'])
+                                          bg=COLORS['bg_info'])
         export_button.pack(side='left', padx=(0, 10))
         
         import_button = self.create_button(button_frame, "📥 Import Settings", self.import_settings,
-                                          bg=CompactStyle.COLORS['bg_warning'])
+                                          bg=COLORS['bg_warning'])
         import_button.pack(side='left', padx=(0, 10))
         
         reset_button = self.create_button(button_frame, "🔄 Reset to Defaults", self.reset_settings,
-                                         bg=CompactStyle.COLORS['bg_danger'])
+                                         bg=COLORS['bg_danger'])
         reset_button.pack(side='right')
     
     def setup_system_info_section(self, parent):
         """Setup system information section"""
         info_frame = self.create_card_tab(parent, "💻 System Information")
         
-        info_container = tk.Frame(info_frame, bg=CompactStyle.COLORS['bg_card'])
+        info_container = tk.Frame(info_frame, bg=COLORS['bg_card'])
         info_container.pack(fill='x', padx=15, pady=15)
         
         # Get system info
-        import platform
-        import cv2
-        
-        system_info = [
-            ("Operating System", f"{platform.system()} {platform.release()}"),
-            ("Python Version", platform.python_version()),
-            ("OpenCV Version", cv2.__version__)]
         system_info = [
             ("Operating System", f"{platform.system()} {platform.release()}"),
             ("Python Version", platform.python_version()),
             ("OpenCV Version", cv2.__version__),
             ("Keyboard Support", "Enabled" if KEYBOARD_AVAILABLE else "Disabled"),
-            ("GPU Support", "Available" if self.settings_manager.get("use_gpu") else "CPU Only")
+            ("Hand Model", "Full" if self._settings["model_complexity"] else "Lite")
         ]
         
         for label, value in system_info:
-            info_item = tk.Frame(info_container, bg=CompactStyle.COLORS['bg_main'], relief='solid', bd=1)
+            info_item = tk.Frame(info_container, bg=COLORS['bg_main'], relief='solid', bd=1)
             info_item.pack(fill='x', pady=2)
             
-            info_content = tk.Frame(info_item, bg=CompactStyle.COLORS['bg_main'])
+            info_content = tk.Frame(info_item, bg=COLORS['bg_main'])
             info_content.pack(fill='x', padx=15, pady=8)
             
-            label_widget = tk.Label(info_content, text=f"{label}:",
-                                   bg=CompactStyle.COLORS['bg_main'], fg=CompactStyle.COLORS['text_primary'],
-                                   font=CompactStyle.FONTS['body'])
+            label_widget = ttk.Label(info_content, text=f"{label}:",
+                                   style='Tile.TLabel')
             label_widget.pack(side='left')
             
-            value_widget = tk.Label(info_content, text=value,
-                                   bg=CompactStyle.COLORS['bg_main'], fg=CompactStyle.COLORS['text_accent'],
-                                   font=CompactStyle.FONTS['body_bold'])
+            value_widget = ttk.Label(info_content, text=value,
+                                   style='TileValue.TLabel')
             value_widget.pack(side='right')
     
     def setup_training_section(self, parent):
         """Setup training section"""
         training_frame = self.create_card_tab(parent, "🎓 Training Mode")
         
-        training_container = tk.Frame(training_frame, bg=CompactStyle.COLORS['bg_card'])
+        training_container = tk.Frame(training_frame, bg=COLORS['bg_card'])
         training_container.pack(fill='x', padx=15, pady=15)
         
-        desc_label = tk.Label(training_container, 
+        desc_label = ttk.Label(training_container, 
                              text="Practice your gestures to improve recognition accuracy.\nThe training mode provides real-time feedback on your hand positions.",
-                             bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_primary'],
-                             font=CompactStyle.FONTS['body'], justify='left')
+                             style='Card.TLabel', justify='left')
         desc_label.pack(anchor='w', pady=(0, 15))
         
         training_button = self.create_button(training_container, "🎯 Open Training Window", self.start_training,
-                                           bg=CompactStyle.COLORS['bg_info'])
+                                           bg=COLORS['bg_info'])
         training_button.pack()
     
     def setup_status_bar(self):
         """Setup status bar"""
-        status_frame = tk.Frame(self.root, bg=CompactStyle.COLORS['bg_header'], height=25)
+        status_frame = tk.Frame(self.root, bg=COLORS['bg_header'], height=25)
         status_frame.pack(side='bottom', fill='x')
         status_frame.pack_propagate(False)
         
-        self.status_var = tk.StringVar(value="Ready to start")
-        status_label = tk.Label(status_frame, textvariable=self.status_var,
-                               bg=CompactStyle.COLORS['bg_header'], fg=CompactStyle.COLORS['text_white'],
-                               font=CompactStyle.FONTS['small'])
-        status_label.pack(side='left', padx=10, pady=4)
+        self._status_text = "Ready to start"
+        self.status_label = ttk.Label(status_frame, text=self._status_text,
+                                    style='StatusBar.TLabel')
+        self.status_label.pack(side='left', padx=10, pady=4)
         
         # Time
-        self.time_var = tk.StringVar()
-        time_label = tk.Label(status_frame, textvariable=self.time_var,
-                             bg=CompactStyle.COLORS['bg_header'], fg=CompactStyle.COLORS['text_white'],
-                             font=CompactStyle.FONTS['small'])
-        time_label.pack(side='right', padx=10, pady=4)
+        self._last_time_str = None
+        self.time_label = ttk.Label(status_frame, style='StatusBar.TLabel')
+        self.time_label.pack(side='right', padx=10, pady=4)
         
         self.update_time()
     
+    def set_status(self, text):
+        """Show text in the status bar (no-op if it is already shown)"""
+        if text != self._status_text:
+            self._status_text = text
+            self.status_label.configure(text=text)
+    
     def create_card_tab(self, parent, title):
         """Create a card container for tabs"""
-        card_frame = tk.Frame(parent, bg=CompactStyle.COLORS['bg_card'], 
+        card_frame = tk.Frame(parent, bg=COLORS['bg_card'], 
                              relief='solid', bd=1)
         card_frame.pack(fill='x', padx=10, pady=5)
         
         # Header
-        header_frame = tk.Frame(card_frame, bg=CompactStyle.COLORS['bg_header'])
+        header_frame = tk.Frame(card_frame, bg=COLORS['bg_header'])
         header_frame.pack(fill='x')
         
-        title_label = tk.Label(header_frame, text=title,
-                              bg=CompactStyle.COLORS['bg_header'], fg=CompactStyle.COLORS['text_white'],
-                              font=CompactStyle.FONTS['heading'])
+        title_label = ttk.Label(header_frame, text=title,
+                              style='CardHeader.TLabel')
         title_label.pack(anchor='w', padx=15, pady=8)
         
         return card_frame
@@ -664,96 +830,115 @@ class MainWindow:
     def create_button(self, parent, text, command, bg=None, size='normal', **kwargs):
         """Create a styled button"""
         if bg is None:
-            bg = CompactStyle.COLORS['bg_button']
+            bg = COLORS['bg_button']
         
-        font = CompactStyle.FONTS['small'] if size == 'small' else CompactStyle.FONTS['body']
+        font = FONTS['small'] if size == 'small' else FONTS['body']
         padx = 8 if size == 'small' else 15
         pady = 4 if size == 'small' else 8
         
+        # Tk draws the pressed color itself; hover comes from the HOVER_BINDTAG bindings
+        hover_bg = self.darken_color(bg)
+        
         button = tk.Button(parent, text=text, command=command,
-                          bg=bg, fg=CompactStyle.COLORS['text_white'],
+                          bg=bg, fg=COLORS['text_white'],
+                          activebackground=hover_bg, activeforeground=COLORS['text_white'],
                           font=font, relief='flat', bd=0,
                           padx=padx, pady=pady, cursor='hand2',
                           **kwargs)
-        
-        # Hover effects
-        def on_enter(e):
-            button.config(bg=self.darken_color(bg))
-        
-        def on_leave(e):
-            button.config(bg=bg)
-        
-        button.bind("<Enter>", on_enter)
-        button.bind("<Leave>", on_leave)
+        button.bindtags((HOVER_BINDTAG,) + button.bindtags())
         
         return button
     
     def create_settings_slider(self, parent, title, setting_key, min_val, max_val, description):
         """Create a settings slider with description"""
-        slider_frame = tk.Frame(parent, bg=CompactStyle.COLORS['bg_card'])
+        # One gridded frame: title/value on row 0, slider on row 1, description on row 2
+        slider_frame = tk.Frame(parent, bg=COLORS['bg_card'])
         slider_frame.pack(fill='x', pady=(0, 15))
+        slider_frame.grid_columnconfigure(0, weight=1)
         
-        # Title and value on same line
-        title_frame = tk.Frame(slider_frame, bg=CompactStyle.COLORS['bg_card'])
-        title_frame.pack(fill='x')
-        
-        title_label = tk.Label(title_frame, text=title + ":",
-                              bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_primary'],
-                              font=CompactStyle.FONTS['body_bold'])
-        title_label.pack(side='left')
+        title_label = ttk.Label(slider_frame, text=title + ":",
+                              style='CardTitle.TLabel')
+        title_label.grid(row=0, column=0, sticky='w')
         
-        current_value = self.settings_manager.get(setting_key)
-        value_label = tk.Label(title_frame, 
+        current_value = self._settings[setting_key]
+        value_label = ttk.Label(slider_frame, 
                               text=f"{current_value:.1f}" if setting_key != 'stability_zone' else str(int(current_value)),
-                              bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_accent'],
-                              font=CompactStyle.FONTS['body_bold'])
-        value_label.pack(side='right')
+                              style='CardValue.TLabel')
+        value_label.grid(row=0, column=1, sticky='e')
         
         # Slider
         slider_var = tk.DoubleVar(value=current_value)
         slider = tk.Scale(slider_frame, from_=min_val, to=max_val, variable=slider_var,
                          orient='horizontal', resolution=0.1 if max_val <= 10 else 1,
-                         bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_primary'],
+                         bg=COLORS['bg_card'], fg=COLORS['text_primary'],
                          highlightthickness=0, showvalue=0,
                          command=lambda val, key=setting_key, lbl=value_label: self.update_settings_slider(key, val, lbl))
-        slider.pack(fill='x', pady=(5, 0))
+        slider.grid(row=1, column=0, columnspan=2, sticky='ew', pady=(5, 0))
         
         # Description
-        desc_label = tk.Label(slider_frame, text=description,
-                             bg=CompactStyle.COLORS['bg_card'], fg=CompactStyle.COLORS['text_secondary'],
-                             font=CompactStyle.FONTS['small'])
-        desc_label.pack(anchor='w', pady=(2, 0))
+        desc_label = ttk.Label(slider_frame, text=description,
+                             style='CardHint.TLabel')
+        desc_label.grid(row=2, column=0, columnspan=2, sticky='w', pady=(2, 0))
         
-        # Store references
-        setattr(self, f"{setting_key}_var", slider_var)
+        # Store references (refresh_gui walks the slider registry)
+        self._setting_vars[setting_key] = slider_var
         setattr(self, f"{setting_key}_label", value_label)
     
     def darken_color(self, color):
         """Darken a color for hover effect"""
-        color_map = {
-            CompactStyle.COLORS['bg_button']: CompactStyle.COLORS['bg_button_hover'],
-            CompactStyle.COLORS['bg_success']: '#229954',
-            CompactStyle.COLORS['bg_danger']: '#c0392b',
-            CompactStyle.COLORS['bg_warning']: '#d68910',
-            CompactStyle.COLORS['bg_info']: '#7d3c98'
-        }
-        return color_map.get(color, color)
+        return _DARKEN_MAP.get(color, color)
     
     def update_time(self):
         """Update time in status bar"""
-        import datetime
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
-        self.time_var.set(current_time)
-        self.root.after(1000, self.update_time)
+        # Nothing to redraw while minimized/hidden; check back less often.
+        # The first call runs before the window is mapped, so always draw once
+        visible = self.root.winfo_viewable() or self._last_time_str is None
+        if visible:
+            current_time = datetime.datetime.now().strftime("%H:%M:%S")
+            if current_time != self._last_time_str:
+                self._last_time_str = current_time
+                self.time_label.configure(text=current_time)
+        
+        self.root.after(1000 if visible else 5000, self.update_time)
     
     def setup_emergency_stop(self):
         """Setup emergency stop hotkey"""
-        if KEYBOARD_AVAILABLE:
-            try:
-                keyboard.add_hotkey('ctrl+alt+q', self.emergency_stop)
-                print("✅ Emergency hotkey (Ctrl+Alt+Q) registered")
-            except Exception as e:
-                print(f"⚠️ Could not setup emergency hotkey: {e}")
+        # Tk binding covers the case where our window has focus, at no cost
+        self._global_hotkey = False
+        self.root.bind_all('<Control-Alt-q>', self._on_emergency_key)
+        
+        # While controlling the cursor other windows have focus, so also hook it globally.
+        # Installing the hook can take a while, so keep it off the Tk thread
+        threading.Thread(target=self._install_global_hotkey, daemon=True).start()
+    
+    def _on_emergency_key(self, event):
+        """In-window Ctrl+Alt+Q; the global hook, once registered, handles it instead"""
+        if not self._global_hotkey:
+            self.emergency_stop()
+    
+    def _install_global_hotkey(self):
+        """Register Ctrl+Alt+Q system-wide via the keyboard package, if installed"""
+        global keyboard, KEYBOARD_AVAILABLE
+        
+        # On Linux the keyboard package needs root; don't pay for an attempt that will fail
+        if platform.system() == "Linux" and os.geteuid() != 0:
+            print("⚠️ Global emergency hotkey needs root on Linux. Using in-window hotkey only.")
+            return
+        
+        try:
+            import keyboard
+            KEYBOARD_AVAILABLE = True
+        except ImportError:
+            print("⚠️ Keyboard library not available. Global emergency hotkey disabled.")
+            return
+        
+        try:
+            # The hook fires on keyboard's thread; hand the stop over to Tk
+            keyboard.add_hotkey('ctrl+alt+q', lambda: self._results.put((self.emergency_stop, ())))
+            self._global_hotkey = True
+            print("✅ Emergency hotkey (Ctrl+Alt+Q) registered")
+        except Exception as e:
+            print(f"⚠️ Could not setup emergency hotkey: {e}")
     
     # Event handlers
     def emergency_stop(self):
@@ -761,24 +946,62 @@ class MainWindow:
         self.stop_control()
         messagebox.showinfo("Emergency Stop", "Cursor control stopped via emergency hotkey!")
     
-    def update_gpu_setting(self):
-        """Update GPU setting"""
-        self.settings_manager.set("use_gpu", self.gpu_var.get())
-        self.settings_manager.save_settings()
+    def update_model_setting(self):
+        """Update hand model (lite/full) setting"""
+        self.settings_manager.set("model_complexity", self.model_var.get())
+        self.schedule_save()
+        
+        # Reinitialize gesture detector once the selection settles
+        if self._pending_model_id:
+            self.root.after_cancel(self._pending_model_id)
+        self._pending_model_id = self.root.after(MODEL_DEBOUNCE_MS, self._apply_model_change)
+    
+    def _apply_model_change(self):
+        """Rebuild the components if the hand model really changed"""
+        self._pending_model_id = None
+        model_complexity = self.settings_manager.get("model_complexity")
+        if model_complexity == self._applied_model:
+            return
+        
+        self._applied_model = model_complexity
+        self.reconfigure_components()
+    
+    def reconfigure_components(self):
+        """Rebuild detector and camera controller in the background after a settings change"""
+        if self.is_running:
+            # The running camera loop holds the current components
+            self.set_status("Restart cursor control to apply the change")
+            return
         
-        # Reinitialize gesture detector
-        if self.gesture_detector:
+        old_detector = self.gesture_detector
+        self.gesture_detector = None
+        self.camera_controller = None
+        
+        self.start_button.config(state='disabled', bg=COLORS['text_secondary'])
+        self.set_status("Reconfiguring...")
+        self._components_gen += 1
+        threading.Thread(target=self._reconfigure_bg, args=(old_detector, self._components_gen),
+                         daemon=True).start()
+    
+    def _reconfigure_bg(self, old_detector, generation):
+        """Release the old detector and build new components (worker thread)"""
+        if old_detector:
             try:
-                self.gesture_detector.cleanup()
-            except:
-                pass
-        self.gesture_detector = GestureDetector(self.settings_manager.settings)
+                old_detector.cleanup()
+            except Exception as e:
+                print(f"Error during cleanup: {e}")
+        
+        self._init_components_bg(generation)
     
     def update_settings_slider(self, setting_key, value, label):
         """Update settings slider"""
         float_value = float(value)
         self.settings_manager.set(setting_key, float_value)
-        self.settings_manager.save_settings()
+        self.schedule_save()
+        
+        # Let the detector pick up the new settings
+        if self.gesture_detector:
+            self.gesture_detector.refresh_settings()
         
         # Update label
         if setting_key == "stability_zone":
@@ -786,45 +1009,92 @@ class MainWindow:
         else:
             label.config(text=f"{float_value:.1f}")
     
+    def schedule_save(self):
+        """Save settings once changes stop arriving; a burst of edits is one write"""
+        if self._pending_save_id:
+            self.root.after_cancel(self._pending_save_id)
+        self._pending_save_id = self.root.after(SAVE_DEBOUNCE_MS, self._flush_settings)
+    
+    def _flush_settings(self):
+        """Hand the pending settings save to the settings manager"""
+        self._pending_save_id = None
+        self.settings_manager.save_settings()
+    
     def update_resolution(self):
         """Update camera resolution"""
         res_str = self.resolution_var.get()
         width, height = map(int, res_str.split('x'))
-        self.settings_manager.set("camera_resolution", [width, height])
-        self.settings_manager.save_settings()
+        self.settings_manager.update({"camera_resolution": [width, height]})
+        self.schedule_save()
     
     def update_visual_feedback(self):
         """Update visual feedback setting"""
         self.settings_manager.set("show_visual_feedback", self.visual_var.get())
-        self.settings_manager.save_settings()
+        self.schedule_save()
+        
+        if self.gesture_detector:
+            self.gesture_detector.refresh_settings()
     
     def test_bookmark(self, index):
         """Test opening a bookmark URL"""
-        url = self.bookmark_entries[index].get().strip()
+        url = self.bookmark_vars[index].get().strip()
         if url:
-            try:
-                import webbrowser
-                if not url.startswith(('http://', 'https://')):
-                    url = 'https://' + url
-                webbrowser.open(url)
-                messagebox.showinfo("Success", f"Opened bookmark {index+1} successfully!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not open URL: {str(e)}")
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+            # Launching the browser can block, so it runs on the I/O worker
+            self.run_io(f"Opening bookmark {index+1}...", webbrowser.open, url,
+                        on_done=partial(self._on_bookmark_opened, index))
         else:
             messagebox.showwarning("Warning", "Please enter a URL first")
     
+    def _on_bookmark_opened(self, index, ok):
+        """Report whether the bookmark test could open a browser"""
+        if ok:
+            messagebox.showinfo("Success", f"Opened bookmark {index+1} successfully!")
+        else:
+            messagebox.showerror("Error", f"Could not open bookmark {index+1}")
+    
     def clear_bookmark(self, index):
         """Clear a bookmark entry"""
-        self.bookmark_entries[index].delete(0, 'end')
+        self.bookmark_vars[index].set("")
+    
+    def run_io(self, status, func, *args, on_done):
+        """Run func(*args) on the I/O worker, then on_done(result) on the Tk thread"""
+        previous_status = self._status_text
+        self.set_status(status)
+        future = self._io_pool.submit(func, *args)
+        future.add_done_callback(
+            lambda f: self._results.put((self._finish_io, (f, previous_status, on_done))))
+    
+    def _finish_io(self, future, previous_status, on_done):
+        """Deliver a finished I/O job's result (Tk thread)"""
+        self.set_status(previous_status)
+        try:
+            ok = future.result()
+        except Exception as e:
+            print(f"❌ I/O error: {e}")
+            ok = False
+        on_done(ok)
     
     def save_bookmarks(self):
         """Save all bookmark URLs"""
-        bookmarks = []
-        for entry in self.bookmark_entries:
-            bookmarks.append(entry.get().strip())
-        
-        self.settings_manager.set("bookmarks", bookmarks)
-        if self.settings_manager.save_settings():
+        bookmarks = [url_var.get().strip() for url_var in self.bookmark_vars]
+        
+        # Compare with what was last written successfully, not the in-memory
+        # value, which a failed save has already changed
+        if bookmarks == self._saved_bookmarks:
+            messagebox.showinfo("Success", "Bookmarks are already saved - no changes to write.")
+            return
+        
+        # One validated update and a single atomic write for all bookmarks
+        self.settings_manager.update({"bookmarks": bookmarks})
+        self.run_io("Saving bookmarks...", self.settings_manager.flush_settings,
+                    on_done=partial(self._on_bookmarks_saved, bookmarks))
+    
+    def _on_bookmarks_saved(self, bookmarks, ok):
+        """Report the bookmark save result"""
+        if ok:
+            self._saved_bookmarks = bookmarks
             messagebox.showinfo("Success", "All bookmarks saved successfully!")
         else:
             messagebox.showerror("Error", "Failed to save bookmarks")
@@ -838,10 +1108,15 @@ class MainWindow:
         )
         
         if filename:
-            if self.settings_manager.export_settings(filename):
-                messagebox.showinfo("Success", "Settings exported successfully!")
-            else:
-                messagebox.showerror("Error", "Failed to export settings")
+            self.run_io("Exporting settings...", self.settings_manager.export_settings, filename,
+                        on_done=self._on_settings_exported)
+    
+    def _on_settings_exported(self, ok):
+        """Report the export result"""
+        if ok:
+            messagebox.showinfo("Success", "Settings exported successfully!")
+        else:
+            messagebox.showerror("Error", "Failed to export settings")
     
     def import_settings(self):
         """Import settings from file"""
@@ -851,11 +1126,17 @@ class MainWindow:
         )
         
         if filename:
-            if self.settings_manager.import_settings(filename):
-                messagebox.showinfo("Success", "Settings imported successfully!\nRestart the application to apply all changes.")
-                self.refresh_gui()
-            else:
-                messagebox.showerror("Error", "Failed to import settings")
+            self.run_io("Importing settings...", self.settings_manager.import_settings, filename,
+                        on_done=self._on_settings_imported)
+    
+    def _on_settings_imported(self, ok):
+        """Report the import result and show the imported values"""
+        if ok:
+            self._saved_bookmarks = list(self.settings_manager.get("bookmarks"))
+            messagebox.showinfo("Success", "Settings imported successfully!\nRestart the application to apply all changes.")
+            self.refresh_gui()
+        else:
+            messagebox.showerror("Error", "Failed to import settings")
     
     def reset_settings(self):
         """Reset settings to defaults"""
@@ -864,6 +1145,7 @@ class MainWindow:
         
         if result:
             if self.settings_manager.reset_to_defaults():
+                self._saved_bookmarks = list(self.settings_manager.get("bookmarks"))
                 messagebox.showinfo("Success", "Settings reset to defaults!\nRestart the application to apply all changes.")
                 self.refresh_gui()
             else:
@@ -872,26 +1154,34 @@ class MainWindow:
     def refresh_gui(self):
         """Refresh GUI with current settings"""
         try:
-            # Update GUI elements with current settings
-            self.gpu_var.set(self.settings_manager.get("use_gpu"))
-            self.visual_var.set(self.settings_manager.get("show_visual_feedback"))
+            # Reset/import change the shared settings dict in place
+            self._settings = settings = self.settings_manager.snapshot()
+            
+            # Tabs that haven't been built yet will read the new values when they are
+            if self.is_tab_built('settings'):
+                # Update GUI elements with current settings
+                set_if_changed(self.model_var, settings["model_complexity"])
+                set_if_changed(self.visual_var, settings["show_visual_feedback"])
+                
+                # Update slider values
+                for setting_key, var in self._setting_vars.items():
+                    set_if_changed(var, settings[setting_key])
+                
+                # Update resolution
+                res = settings["camera_resolution"]
+                set_if_changed(self.resolution_var, f"{res[0]}x{res[1]}")
             
-            # Update slider values
-            for setting in ["cursor_sensitivity", "click_rate", "gesture_threshold", "stability_zone"]:
-                var = getattr(self, f"{setting}_var", None)
-                if var:
-                    var.set(self.settings_manager.get(setting))
+            if self.is_tab_built('bookmarks'):
+                # Update bookmark entries
+                bookmarks = settings["bookmarks"]
+                for i, url_var in enumerate(self.bookmark_vars):
+                    set_if_changed(url_var, bookmarks[i] if i < len(bookmarks) else "")
             
-            # Update bookmark entries
-            bookmarks = self.settings_manager.get("bookmarks")
-            for i, entry in enumerate(self.bookmark_entries):
-                entry.delete(0, 'end')
-                if i < len(bookmarks):
-                    entry.insert(0, bookmarks[i])
+            if self.gesture_detector:
+                self.gesture_detector.refresh_settings()
             
-            # Update resolution
-            res = self.settings_manager.get("camera_resolution")
-            self.resolution_var.set(f"{res[0]}x{res[1]}")
+            # A different hand model needs a new detector
+            self._apply_model_change()
         except Exception as e:
             print(f"Error refreshing GUI: {e}")
     
@@ -900,17 +1190,18 @@ class MainWindow:
         if not self.is_running:
             try:
                 self.is_running = True
-                self.start_button.config(state='disabled', bg=CompactStyle.COLORS['text_secondary'])
-                self.stop_button.config(state='normal', bg=CompactStyle.COLORS['bg_danger'])
-                self.status_var.set("Starting cursor control...")
+                self.start_button.config(state='disabled', bg=COLORS['text_secondary'])
+                self.stop_button.config(state='normal', bg=COLORS['bg_danger'])
+                self.set_status("Starting cursor control...")
                 
                 # Ensure components are initialized
                 if not self.camera_controller:
-                    self.initialize_components()
+                    self._components_gen += 1  # Supersede any background build
+                    self.gesture_detector, self.camera_controller = self._build_components()
                 
                 # Start camera controller
                 if self.camera_controller and self.camera_controller.start_camera():
-                    self.status_var.set("Cursor control active - Camera window opened")
+                    self.set_status("Cursor control active - Camera window opened")
                     self.start_performance_monitoring()
                 else:
                     self.stop_control()
@@ -919,14 +1210,13 @@ class MainWindow:
                 self.stop_control()
                 messagebox.showerror("Error", f"Failed to start cursor control: {str(e)}")
     
-    def stop_control(self):
-        """Stop cursor control"""
+    def stop_control(self, rebuild=True):
+        """Stop cursor control; rebuild prepares new components for the next Start"""
         if self.is_running:
             try:
                 self.is_running = False
-                self.start_button.config(state='normal', bg=CompactStyle.COLORS['bg_success'])
-                self.stop_button.config(state='disabled', bg=CompactStyle.COLORS['text_secondary'])
-                self.status_var.set("Stopping cursor control...")
+                self.stop_button.config(state='disabled', bg=COLORS['text_secondary'])
+                self.set_status("Stopping cursor control...")
                 
                 # Stop camera controller
                 if self.camera_controller:
@@ -939,10 +1229,20 @@ class MainWindow:
                     except Exception as e:
                         print(f"Error during cleanup: {e}")
                 
-                self.status_var.set("Cursor control stopped")
+                # The released components can't be restarted; build new ones in the
+                # background so the next Start doesn't load MediaPipe on the Tk thread.
+                # Start stays disabled until _on_components_ready
+                self.gesture_detector = None
+                self.camera_controller = None
+                
+                if rebuild:
+                    self.initialize_components()
+                else:
+                    self.set_status("Cursor control stopped")
             except Exception as e:
                 print(f"Error stopping control: {e}")
-                self.status_var.set("Error stopping cursor control")
+                self.start_button.config(state='normal', bg=COLORS['bg_success'])
+                self.set_status("Error stopping cursor control")
     
     def start_training(self):
         """Start training mode"""
@@ -958,29 +1258,62 @@ class MainWindow:
     
     def start_performance_monitoring(self):
         """Start performance monitoring"""
-        def update_performance():
-            if self.is_running and self.camera_controller:
+        self._latest_stats = {}
+        self._poll_queue()
+    
+    def _poll_queue(self):
+        """Drain camera updates and push changed values to the status indicators"""
+        if not (self.is_running and self.camera_controller):
+            return
+        
+        try:
+            update = None
+            while True:
                 try:
-                    perf_data = self.camera_controller.get_performance_data()
-                    self.fps_var.set(f"{perf_data['fps']:.1f}")
-                    self.gesture_var.set(perf_data['gesture'])
-                    self.confidence_var.set(f"{perf_data['confidence']:.0%}")
-                except Exception as e:
-                    print(f"Performance monitoring error: {e}")
+                    update = self.update_queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if update is not None:
+                fps, gesture, confidence = update
+                stats = {
+                    "fps": f"{fps:.1f}",
+                    "gesture": gesture,
+                    "confidence": f"{confidence:.0%}"
+                }
                 
-                # Schedule next update
-                self.root.after(1000, update_performance)
+                # Only reconfigure the labels whose text actually changed
+                for key, text in stats.items():
+                    if self._latest_stats.get(key) != text:
+                        self._stat_labels[key].configure(text=text)
+                self._latest_stats = stats
+        except Exception as e:
+            print(f"Performance monitoring error: {e}")
         
-        update_performance()
+        # Schedule next update
+        self.root.after(PERF_REFRESH_MS, self._poll_queue)
     
     def on_closing(self):
         """Handle application closing"""
         try:
             if self.is_running:
-                self.stop_control()
+                self.stop_control(rebuild=False)
+            
+            # Release the MediaPipe graph explicitly rather than leaving it to GC
+            # (stop_control already did this if control was running)
+            elif self.gesture_detector:
+                try:
+                    self.gesture_detector.cleanup()
+                except Exception as e:
+                    print(f"Error during cleanup: {e}")
             
-            # Save settings before closing
-            self.settings_manager.save_settings()
+            # Save settings before closing (synchronously, the saver is a daemon).
+            # Queued I/O is dropped; a running job isn't waited for, its result
+            # is simply never delivered
+            if self._pending_save_id:
+                self.root.after_cancel(self._pending_save_id)
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            self.settings_manager.flush_settings()
             
             # Clean up emergency hotkey
             if KEYBOARD_AVAILABLE:
@@ -5,53 +5,156 @@ Custom modern-styled widgets for enhanced user experience
 
 import tkinter as tk
 from tkinter import ttk
+from types import MappingProxyType
+
+# ModernButton color schemes, shared by all buttons
+_COLOR_SCHEMES = MappingProxyType({
+    "primary": {
+        "bg": "#2563eb",
+        "fg": "white",
+        "hover_bg": "#1d4ed8",
+        "active_bg": "#1e40af"
+    },
+    "success": {
+        "bg": "#10b981",
+        "fg": "white", 
+        "hover_bg": "#059669",
+        "active_bg": "#047857"
+    },
+    "danger": {
+        "bg": "#ef4444",
+        "fg": "white",
+        "hover_bg": "#dc2626",
+        "active_bg": "#b91c1c"
+    },
+    "warning": {
+        "bg": "#f59e0b",
+        "fg": "white",
+        "hover_bg": "#d97706",
+        "active_bg": "#b45309"
+    },
+    "info": {
+        "bg": "#06b6d4",
+        "fg": "white",
+        "hover_bg": "#0891b2",
+        "active_bg": "#0e7490"
+    },
+    "secondary": {
+        "bg": "#6b7280",
+        "fg": "white",
+        "hover_bg": "#4b5563",
+        "active_bg": "#374151"
+    }
+})
+
+# ModernFrame styles
+_FRAME_STYLES = MappingProxyType({
+    "card": {
+        "bg": "#ffffff",
+        "relief": "solid",
+        "bd": 1,
+        "padx": 0,
+        "pady": 0
+    },
+    "surface": {
+        "bg": "#f1f5f9",
+        "relief": "flat",
+        "bd": 0,
+        "padx": 10,
+        "pady": 10
+    },
+    "dark": {
+        "bg": "#1e293b",
+        "relief": "flat",
+        "bd": 0,
+        "padx": 10,
+        "pady": 10
+    }
+})
+
+# ModernLabel text styles
+_LABEL_STYLES = MappingProxyType({
+    "title": {
+        "font": ("Segoe UI", 24, "bold"),
+        "fg": "#1e293b"
+    },
+    "heading": {
+        "font": ("Segoe UI", 18, "bold"),
+        "fg": "#1e293b"
+    },
+    "subheading": {
+        "font": ("Segoe UI", 14, "bold"),
+        "fg": "#374151"
+    },
+    "normal": {
+        "font": ("Segoe UI", 11),
+        "fg": "#4b5563"
+    },
+    "small": {
+        "font": ("Segoe UI", 9),
+        "fg": "#6b7280"
+    },
+    "accent": {
+        "font": ("Segoe UI", 11, "bold"),
+        "fg": "#2563eb"
+    },
+    "success": {
+        "font": ("Segoe UI", 11, "bold"),
+        "fg": "#059669"
+    },
+    "danger": {
+        "font": ("Segoe UI", 11, "bold"),
+        "fg": "#dc2626"
+    },
+    "warning": {
+        "font": ("Segoe UI", 11, "bold"),
+        "fg": "#d97706"
+    }
+})
+
+# Set once the Modern.* ttk styles have been registered with the theme
+_MODERN_STYLES_READY = False
+
+def _init_modern_styles():
+    """Register the Modern.* ttk styles the first time they're needed"""
+    global _MODERN_STYLES_READY
+    if _MODERN_STYLES_READY:
+        return
+    
+    style = ttk.Style()
+    style.configure("Modern.Horizontal.TProgressbar",
+                   background="#2563eb",
+                   troughcolor="#e5e7eb",
+                   borderwidth=0,
+                   lightcolor="#2563eb",
+                   darkcolor="#2563eb")
+    
+    # Configure tab appearance
+    style.configure("Modern.TNotebook.Tab",
+                   padding=[20, 10],
+                   font=("Segoe UI", 11, "bold"))
+    
+    style.map("Modern.TNotebook.Tab",
+             background=[("selected", "#2563eb"),
+                       ("active", "#3b82f6"),
+                       ("!active", "#f1f5f9")],
+             foreground=[("selected", "white"),
+                       ("active", "white"),
+                       ("!active", "#4b5563")])
+    
+    _MODERN_STYLES_READY = True
 
 class ModernButton(tk.Button):
     """Modern styled button with hover effects"""
     
+    color_schemes = _COLOR_SCHEMES
+    
+    # Hover handlers are bound once for the "ModernButton" bindtag, not per instance
+    _class_bound = False
+    
     def __init__(self, parent, text="", command=None, style="primary", **kwargs):
-        # Define color schemes
-        self.color_schemes = {
-            "primary": {
-                "bg": "#2563eb",
-                "fg": "white",
-                "hover_bg": "#1d4ed8",
-                "active_bg": "#1e40af"
-            },
-            "success": {
-                "bg": "#10b981",
-                "fg": "white", 
-                "hover_bg": "#059669",
-                "active_bg": "#047857"
-            },
-            "danger": {
-                "bg": "#ef4444",
-                "fg": "white",
-                "hover_bg": "#dc2626",
-                "active_bg": "#b91c1c"
-            },
-            "warning": {
-                "bg": "#f59e0b",
-                "fg": "white",
-                "hover_bg": "#d97706",
-                "active_bg": "#b45309"
-            },
-            "info": {
-                "bg": "#06b6d4",
-                "fg": "white",
-                "hover_bg": "#0891b2",
-                "active_bg": "#0e7490"
-            },
-            "secondary": {
-                "bg": "#6b7280",
-                "fg": "white",
-                "hover_bg": "#4b5563",
-                "active_bg": "#374151"
-            }
-        }
-        
         self.style = style
-        colors = self.color_schemes.get(style, self.color_schemes["primary"])
+        colors = _COLOR_SCHEMES.get(style, _COLOR_SCHEMES["primary"])
         
         # Default button configuration
         default_config = {
@@ -65,6 +168,8 @@ class ModernButton(tk.Button):
             "padx": 20,
             "pady": 10,
             "cursor": "hand2",
+            # Pressed color; Tk only draws it while the button is held on Windows,
+            # so hover is handled by the bindtag handlers below
             "activebackground": colors["active_bg"],
             "activeforeground": colors["fg"]
         }
@@ -79,59 +184,30 @@ class ModernButton(tk.Button):
         self.hover_bg = colors["hover_bg"]
         self.active_bg = colors["active_bg"]
         
-        # Bind hover events
-        self.bind("<Enter>", self.on_hover)
-        self.bind("<Leave>", self.on_leave)
-        self.bind("<Button-1>", self.on_click)
-        self.bind("<ButtonRelease-1>", self.on_release)
+        self.bindtags(("ModernButton",) + self.bindtags())
+        if not ModernButton._class_bound:
+            self.bind_class("ModernButton", "<Enter>", ModernButton.on_hover)
+            self.bind_class("ModernButton", "<Leave>", ModernButton.on_leave)
+            ModernButton._class_bound = True
     
-    def on_hover(self, event):
+    @staticmethod
+    def on_hover(event):
         """Handle mouse hover"""
-        self.config(bg=self.hover_bg)
+        event.widget.config(bg=event.widget.hover_bg)
     
-    def on_leave(self, event):
+    @staticmethod
+    def on_leave(event):
         """Handle mouse leave"""
-        self.config(bg=self.normal_bg)
-    
-    def on_click(self, event):
-        """Handle mouse click"""
-        self.config(bg=self.active_bg)
-    
-    def on_release(self, event):
-        """Handle mouse release"""
-        self.config(bg=self.hover_bg)
+        event.widget.config(bg=event.widget.normal_bg)
 
 class ModernFrame(tk.Frame):
     """Modern styled frame with rounded corners effect"""
     
+    styles = _FRAME_STYLES
+    
     def __init__(self, parent, style="card", **kwargs):
-        # Define frame styles
-        self.styles = {
-            "card": {
-                "bg": "#ffffff",
-                "relief": "solid",
-                "bd": 1,
-                "padx": 0,
-                "pady": 0
-            },
-            "surface": {
-                "bg": "#f1f5f9",
-                "relief": "flat",
-                "bd": 0,
-                "padx": 10,
-                "pady": 10
-            },
-            "dark": {
-                "bg": "#1e293b",
-                "relief": "flat",
-                "bd": 0,
-                "padx": 10,
-                "pady": 10
-            }
-        }
-        
         # Get style configuration
-        style_config = self.styles.get(style, self.styles["card"])
+        style_config = dict(_FRAME_STYLES.get(style, _FRAME_STYLES["card"]))
         style_config.update(kwargs)
         
         super().__init__(parent, **style_config)
@@ -159,6 +235,9 @@ class ModernScale(tk.Scale):
 class ModernEntry(tk.Entry):
     """Modern styled entry widget"""
     
+    # Placeholder handlers are bound once for the "ModernEntry" bindtag, not per instance
+    _class_bound = False
+    
     def __init__(self, parent, placeholder="", **kwargs):
         self.placeholder = placeholder
         self.placeholder_color = "#9ca3af"
@@ -185,20 +264,27 @@ class ModernEntry(tk.Entry):
             self.insert(0, placeholder)
             self.config(fg=self.placeholder_color)
             
-            self.bind("<FocusIn>", self.on_focus_in)
-            self.bind("<FocusOut>", self.on_focus_out)
+            self.bindtags(("ModernEntry",) + self.bindtags())
+            if not ModernEntry._class_bound:
+                self.bind_class("ModernEntry", "<FocusIn>", ModernEntry.on_focus_in)
+                self.bind_class("ModernEntry", "<FocusOut>", ModernEntry.on_focus_out)
+                ModernEntry._class_bound = True
     
-    def on_focus_in(self, event):
+    @staticmethod
+    def on_focus_in(event):
         """Handle focus in"""
-        if self.get() == self.placeholder:
-            self.delete(0, tk.END)
-            self.config(fg=self.normal_color)
+        entry = event.widget
+        if entry.get() == entry.placeholder:
+            entry.delete(0, tk.END)
+            entry.config(fg=entry.normal_color)
     
-    def on_focus_out(self, event):
+    @staticmethod
+    def on_focus_out(event):
         """Handle focus out"""
-        if not self.get():
-            self.insert(0, self.placeholder)
-            self.config(fg=self.placeholder_color)
+        entry = event.widget
+        if not entry.get():
+            entry.insert(0, entry.placeholder)
+            entry.config(fg=entry.placeholder_color)
     
     def get_value(self):
         """Get actual value (excluding placeholder)"""
@@ -208,47 +294,9 @@ class ModernEntry(tk.Entry):
 class ModernLabel(tk.Label):
     """Modern styled label"""
     
+    styles = _LABEL_STYLES
+    
     def __init__(self, parent, text="", style="normal", **kwargs):
-        # Define label styles
-        self.styles = {
-            "title": {
-                "font": ("Segoe UI", 24, "bold"),
-                "fg": "#1e293b"
-            },
-            "heading": {
-                "font": ("Segoe UI", 18, "bold"),
-                "fg": "#1e293b"
-            },
-            "subheading": {
-                "font": ("Segoe UI", 14, "bold"),
-                "fg": "#374151"
-            },
-            "normal": {
-                "font": ("Segoe UI", 11),
-                "fg": "#4b5563"
-            },
-            "small": {
-                "font": ("Segoe UI", 9),
-                "fg": "#6b7280"
-            },
-            "accent": {
-                "font": ("Segoe UI", 11, "bold"),
-                "fg": "#2563eb"
-            },
-            "success": {
-                "font": ("Segoe UI", 11, "bold"),
-                "fg": "#059669"
-            },
-            "danger": {
-                "font": ("Segoe UI", 11, "bold"),
-                "fg": "#dc2626"
-            },
-            "warning": {
-                "font": ("Segoe UI", 11, "bold"),
-                "fg": "#d97706"
-            }
-        }
-        
         # Default configuration
         default_config = {
             "text": text,
@@ -257,7 +305,7 @@ class ModernLabel(tk.Label):
         }
         
         # Apply style
-        style_config = self.styles.get(style, self.styles["normal"])
+        style_config = _LABEL_STYLES.get(style, _LABEL_STYLES["normal"])
         default_config.update(style_config)
         default_config.update(kwargs)
         
@@ -290,13 +338,7 @@ class ModernProgressbar(ttk.Progressbar):
     
     def __init__(self, parent, **kwargs):
         # Configure style
-        style = ttk.Style()
-        style.configure("Modern.Horizontal.TProgressbar",
-                       background="#2563eb",
-                       troughcolor="#e5e7eb",
-                       borderwidth=0,
-                       lightcolor="#2563eb",
-                       darkcolor="#2563eb")
+        _init_modern_styles()
         
         default_config = {
             "style": "Modern.Horizontal.TProgressbar",
@@ -343,20 +385,7 @@ class ModernNotebook(ttk.Notebook):
     
     def __init__(self, parent, **kwargs):
         # Configure modern tab style
-        style = ttk.Style()
-        
-        # Configure tab appearance
-        style.configure("Modern.TNotebook.Tab",
-                       padding=[20, 10],
-                       font=("Segoe UI", 11, "bold"))
-        
-        style.map("Modern.TNotebook.Tab",
-                 background=[("selected", "#2563eb"),
-                           ("active", "#3b82f6"),
-                           ("!active", "#f1f5f9")],
-                 foreground=[("selected", "white"),
-                           ("active", "white"),
-                           ("!active", "#4b5563")])
+        _init_modern_styles()
         
         default_config = {
             "style": "Modern.TNotebook"
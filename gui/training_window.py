@@ -6,17 +6,46 @@ Provides gesture training and practice mode
 import tkinter as tk
 from tkinter import ttk, messagebox
 import cv2
+import numpy as np
+import sys
 import threading
 import time
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from types import MappingProxyType
 
+from core.camera_controller import INFERENCE_WIDTH
+from core.frame_grabber import FrameGrabber, frame_signature
 from core.gesture_detector import GestureDetector
 
+# Translucent info box on the training camera feed (x1, y1, x2, y2)
+OVERLAY_BOX = (10, 10, 630, 150)
+
+# Minimum seconds between training panel refreshes (~10 Hz)
+GUI_UPDATE_INTERVAL = 0.1
+
+# Hand detection runs on every Nth frame; frames in between reuse its result
+INFER_EVERY = 2
+
+# Non-blocking key check (OpenCV 4.5+); older versions fall back to a 1 ms wait
+if hasattr(cv2, "pollKey"):
+    poll_key = cv2.pollKey
+else:
+    poll_key = lambda: cv2.waitKey(1)
+
 class TrainingWindow:
+    # Color scheme (matching main window)
+    _COLORS = MappingProxyType({
+        'primary': '#2563eb',
+        'secondary': '#f59e0b',
+        'success': '#10b981',
+        'danger': '#ef4444',
+        'warning': '#f59e0b',
+        'info': '#06b6d4',
+        'light': '#f8fafc',
+        'dark': '#1e293b',
+        'background': '#ffffff',
+        'surface': '#f1f5f9'
+    })
+    
     def __init__(self, parent, settings_manager):
         self.parent = parent
         self.settings_manager = settings_manager
@@ -28,9 +57,27 @@ class TrainingWindow:
         # Initialize components
         self.gesture_detector = GestureDetector(settings_manager.settings)
         self.cap = None
+        self.grabber = None
         self.is_training = False
+        
+        # Signature and hand detection result of the last processed frame
+        self._last_sig = None
+        self._last_result = None
+        self._last_gesture = ("None", 0.0)
+        self._frame_ix = 0
         self.training_thread = None
         
+        # Reused RGB buffer for the inference frame, and its width
+        self._rgb_buf = None
+        self._inference_width = settings_manager.get("inference_width", INFERENCE_WIDTH)
+        
+        # Time of the last panel refresh and the counts currently shown
+        self._last_gui_update = 0.0
+        self._shown_stats = {}
+        
+        # Static camera overlay text, rendered once
+        self._static_overlay, self._static_overlay_mask = self._render_static_overlay()
+        
         # Training statistics
         self.gesture_stats = {
             "One Finger": 0,
@@ -67,19 +114,8 @@ class TrainingWindow:
         y = parent_y + 50
         self.window.geometry(f"800x700+{x}+{y}")
         
-        # Color scheme (matching main window)
-        self.colors = {
-            'primary': '#2563eb',
-            'secondary': '#f59e0b',
-            'success': '#10b981',
-            'danger': '#ef4444',
-            'warning': '#f59e0b',
-            'info': '#06b6d4',
-            'light': '#f8fafc',
-            'dark': '#1e293b',
-            'background': '#ffffff',
-            'surface': '#f1f5f9'
-        }
+        # Color scheme (matching main window), shared by all training windows
+        self.colors = self._COLORS
         
         self.window.configure(bg=self.colors['light'])
     
@@ -321,18 +357,26 @@ Welcome to Gesture Training Mode! This mode helps you practice and perfect your
             self.stop_training_button.config(state='disabled')
             self.training_status_var.set("Training stopped")
             
-            # Clean up camera safely
-            try:
-                if self.cap:
-                    self.cap.release()
-                    self.cap = None
-            except Exception as e:
-                print(f"Error releasing training camera: {e}")
+            self._release()
+    
+    def _release(self, release_detector=False):
+        """Release the frame reader, camera, OpenCV windows and optionally the detector"""
+        try:
+            # Stop the frame reader before releasing the camera it reads from
+            if self.grabber:
+                self.grabber.stop()
+                self.grabber = None
             
-            try:
-                cv2.destroyAllWindows()
-            except Exception as e:
-                print(f"Error closing training windows: {e}")
+            if self.cap:
+                self.cap.release()
+                self.cap = None
+            
+            cv2.destroyAllWindows()
+            
+            if release_detector and self.gesture_detector:
+                self.gesture_detector.cleanup()
+        except Exception as e:
+            print(f"Training cleanup error: {e}")
     
     def on_closing(self):
         """Handle window closing safely"""
@@ -340,12 +384,8 @@ Welcome to Gesture Training Mode! This mode helps you practice and perfect your
             if self.is_training:
                 self.stop_training()
             
-            # Clean up gesture detector safely
-            if self.gesture_detector:
-                try:
-                    self.gesture_detector.cleanup()
-                except Exception as e:
-                    print(f"Training cleanup error: {e}")
+            # Release MediaPipe (and anything stop_training didn't)
+            self._release(release_detector=True)
             
             # Destroy window
             self.window.destroy()
@@ -360,14 +400,26 @@ Welcome to Gesture Training Mode! This mode helps you practice and perfect your
     def training_loop(self):
         """Main training loop"""
         try:
-            # Initialize camera
-            self.cap = cv2.VideoCapture(0)
+            # Initialize camera (native backends open faster and honour MJPG)
+            if sys.platform == "win32":
+                self.cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
+            elif sys.platform.startswith("linux"):
+                self.cap = cv2.VideoCapture(0, cv2.CAP_V4L2)
+            else:
+                self.cap = cv2.VideoCapture(0)
+            
+            # Compressed frames keep USB bandwidth (and driver latency) down
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
             
             # Set camera resolution
             width, height = self.settings_manager.get("camera_resolution")
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
             
+            # Only keep the newest frame queued so feedback isn't frames behind
+            if not self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+                print("⚠️ Camera backend ignored CAP_PROP_BUFFERSIZE; frames may lag")
+            
             if not self.cap.isOpened():
                 messagebox.showerror("Camera Error", "Cannot open camera for training!")
                 self.stop_training()
@@ -375,21 +427,40 @@ Welcome to Gesture Training Mode! This mode helps you practice and perfect your
             
             self.training_status_var.set("Training active - Practice your gestures!")
             
+            self._last_sig = None
+            self._last_result = None
+            self._last_gesture = ("None", 0.0)
+            self._frame_ix = 0
+            
+            # Frames are read on their own thread; inference always gets the newest
+            self.grabber = grabber = FrameGrabber(self.cap).start()
+            topmost_set = False
+            
             while self.is_training:
-                success, img = self.cap.read()
+                success, img = grabber.read()
                 if not success:
                     break
                 
                 # Flip image for mirror effect
                 img = cv2.flip(img, 1)
-                img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
                 
-                # Process hand detection
-                result_hands = self.gesture_detector.hands.process(img_rgb)
                 h, w, _ = img.shape
                 
-                gesture_name = "None"
-                confidence = 0.0
+                # Process hand detection every INFER_EVERY-th frame, unless the camera
+                # re-delivered the same frame; in between the last result is reused
+                self._frame_ix += 1
+                fresh = False
+                if self._last_result is None or self._frame_ix % INFER_EVERY == 0:
+                    sig = frame_signature(img)
+                    if sig != self._last_sig or self._last_result is None:
+                        self._last_result = self.detect_hands(img, w, h)
+                        self._last_sig = sig
+                        fresh = True
+                result_hands = self._last_result
+                
+                # Gestures are only classified (and counted) on new detections
+                if fresh:
+                    self._last_gesture = ("None", 0.0)
                 
                 if result_hands.multi_hand_landmarks:
                     for hand_landmarks in result_hands.multi_hand_landmarks:
@@ -397,13 +468,19 @@ Welcome to Gesture Training Mode! This mode helps you practice and perfect your
                         self.gesture_detector.mp_draw.draw_landmarks(
                             img, hand_landmarks, self.gesture_detector.mp_hands.HAND_CONNECTIONS)
                         
+                        if not fresh:
+                            continue
+                        
                         # Detect gesture
                         gesture_name, confidence, lmList = self.gesture_detector.detect_gesture(hand_landmarks, w, h)
+                        self._last_gesture = (gesture_name, confidence)
                         
                         # Update statistics if confidence is high enough
                         if confidence > 0.7 and gesture_name in self.gesture_stats:
                             self.gesture_stats[gesture_name] += 1
                 
+                gesture_name, confidence = self._last_gesture
+                
                 # Update GUI
                 self.update_training_display(gesture_name, confidence)
                 
@@ -413,13 +490,16 @@ Welcome to Gesture Training Mode! This mode helps you practice and perfect your
                 # Display image
                 cv2.imshow("🎓 Gesture Training - Camera Feed", img)
                 
-                # Make window stay on top
-                try:
-                    cv2.setWindowProperty("🎓 Gesture Training - Camera Feed", cv2.WND_PROP_TOPMOST, 1)
-                except:
-                    pass
+                # Make window stay on top (once, the property sticks to the window)
+                if not topmost_set:
+                    topmost_set = True
+                    try:
+                        cv2.setWindowProperty("🎓 Gesture Training - Camera Feed", cv2.WND_PROP_TOPMOST, 1)
+                    except:
+                        pass
                 
-                if cv2.waitKey(1) & 0xFF == ord('q'):
+                key = poll_key()
+                if key != -1 and key & 0xFF == ord('q'):
                     break
         
         except Exception as e:
@@ -427,7 +507,30 @@ Welcome to Gesture Training Mode! This mode helps you practice and perfect your
         finally:
             self.stop_training()
     
+    def detect_hands(self, img, w, h):
+        """Run hand detection on a downscaled RGB copy of the frame"""
+        # Landmarks are normalized, so they still map onto the full-size frame
+        width = self._inference_width
+        if w > width:
+            img = cv2.resize(img, (width, int(h * width / w)),
+                             interpolation=cv2.INTER_AREA)
+        if self._rgb_buf is None or self._rgb_buf.shape != img.shape:
+            self._rgb_buf = np.empty_like(img)
+        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        return self.gesture_detector.hands.process(img_rgb)
+    
     def update_training_display(self, gesture_name, confidence):
+        """Queue a training display refresh from the camera thread (throttled)"""
+        now = time.monotonic()
+        if now - self._last_gui_update < GUI_UPDATE_INTERVAL or not self.is_training:
+            return
+        self._last_gui_update = now
+        
+        # Tk isn't thread-safe: hand a snapshot of the counts to the Tk thread
+        self.window.after_idle(self._apply_training_display, gesture_name, confidence,
+                               dict(self.gesture_stats))
+    
+    def _apply_training_display(self, gesture_name, confidence, stats):
         """Update training display with current gesture info"""
         self.current_gesture_var.set(gesture_name)
         self.confidence_var.set(f"{confidence:.1%}")
@@ -442,22 +545,28 @@ Welcome to Gesture Training Mode! This mode helps you practice and perfect your
         else:
             self.tips_var.set("Excellent! Perfect gesture recognition. Try the next gesture!")
         
-        # Update statistics display
-        for gesture, count in self.gesture_stats.items():
-            if gesture in self.stats_labels:
+        # Update statistics display, only for counts that changed
+        for gesture, count in stats.items():
+            if gesture in self.stats_labels and self._shown_stats.get(gesture) != count:
+                self._shown_stats[gesture] = count
                 self.stats_labels[gesture].set(str(count))
     
     def add_training_overlay(self, img, gesture_name, confidence):
         """Add training overlay to camera image"""
-        # Semi-transparent background for text
-        overlay = img.copy()
-        cv2.rectangle(overlay, (10, 10), (630, 150), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, img, 0.3, 0, img)
+        # Semi-transparent background for text, blended only inside its box
+        x1, y1, x2, y2 = OVERLAY_BOX
+        roi = img[y1:y2 + 1, x1:x2 + 1]
+        cv2.addWeighted(roi, 0.3, roi, 0, 0, dst=roi)
+        
+        # Static title and hint, pre-rendered once. The layer can be wider than
+        # the box (the hint runs past it), so it gets its own region
+        layer_h, layer_w = self._static_overlay.shape[:2]
+        region = img[y1:y1 + layer_h, x1:x1 + layer_w]
+        region_h, region_w = region.shape[:2]
+        mask = self._static_overlay_mask[:region_h, :region_w]
+        region[mask] = self._static_overlay[:region_h, :region_w][mask]
         
         # Training info
-        cv2.putText(img, "🎓 TRAINING MODE", (20, 40),
-                   cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
-        
         cv2.putText(img, f"Current Gesture: {gesture_name}", (20, 70),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
         
@@ -469,10 +578,25 @@ Welcome to Gesture Training Mode! This mode helps you practice and perfect your
         quality_text = "EXCELLENT" if confidence > 0.8 else "GOOD" if confidence > 0.5 else "PRACTICE MORE"
         cv2.putText(img, f"Quality: {quality_text}", (20, 130),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, confidence_color, 2)
+    
+    def _render_static_overlay(self):
+        """Render the overlay text that never changes into a layer and mask"""
+        x1, y1, x2, y2 = OVERLAY_BOX
+        hint = "Press 'q' to close camera"
+        (hint_w, _), _ = cv2.getTextSize(hint, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+        
+        # Wide enough for the whole hint, which starts at x=450
+        layer_w = max(x2, 450 + hint_w) - x1 + 1
+        layer = np.zeros((y2 - y1 + 1, layer_w, 3), np.uint8)
+        
+        cv2.putText(layer, "🎓 TRAINING MODE", (20 - x1, 40 - y1),
+                   cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
         
         # Instructions
-        cv2.putText(img, "Press 'q' to close camera", (450, 130),
+        cv2.putText(layer, hint, (450 - x1, 130 - y1),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        
+        return layer, layer.any(axis=2)
     
     def reset_statistics(self):
         """Reset training statistics"""
@@ -485,17 +609,7 @@ Welcome to Gesture Training Mode! This mode helps you practice and perfect your
             # Update display
             for gesture, count in self.gesture_stats.items():
                 if gesture in self.stats_labels:
+                    self._shown_stats[gesture] = 0
                     self.stats_labels[gesture].set("0")
             
             messagebox.showinfo("Statistics Reset", "All training statistics have been reset!")
-    
-    def on_closing(self):
-        """Handle window closing"""
-        if self.is_training:
-            self.stop_training()
-        
-        # Clean up gesture detector
-        self.gesture_detector.cleanup()
-        
-        self.window.destroy()
-        print("🎓 Training window closed")
\ No newline at end of file
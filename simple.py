@@ -2,7 +2,84 @@ import cv2
 import mediapipe as mp
 import pyautogui
 import numpy as np
-import math
+import sys
+import time
+
+from core.frame_grabber import FrameGrabber, frame_signature
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Minimum seconds between two clicks of the same kind
+CLICK_COOLDOWN = 0.3
+
+# Index-thumb distance (pixels) below which the hand counts as pinching
+PINCH_DISTANCE = 40
+
+# On-screen instructions and the area they are drawn in (x1, y1, x2, y2)
+INSTRUCTIONS = [
+    "Point finger to move cursor",
+    "Pinch to click",
+    "Peace sign for right click",
+    "Press 'q' to quit"
+]
+INSTRUCTIONS_BOX = (0, 0, 420, 130)
+
+def render_instructions_mask():
+    """Render the static instructions text once into a boolean mask"""
+    x1, y1, x2, y2 = INSTRUCTIONS_BOX
+    layer = np.zeros((y2 - y1 + 1, x2 - x1 + 1), np.uint8)
+    
+    for i, instruction in enumerate(INSTRUCTIONS):
+        cv2.putText(layer, instruction, (10 - x1, 30 + i * 30 - y1), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, 255, 2)
+    
+    return layer > 0
+
+# Finger-state key for the peace sign (index + middle up), see fingers_bits
+PEACE_SIGN = 0b01100
+
+def fingers_bits(lm):
+    """Pack finger states (thumb, index, middle, ring, pinky) into a 5-bit int"""
+    bits = int(lm[4, 0] > lm[3, 0]) << 4        # Thumb
+    bits |= int(lm[8, 1] < lm[6, 1]) << 3       # Index
+    bits |= int(lm[12, 1] < lm[10, 1]) << 2     # Middle
+    bits |= int(lm[16, 1] < lm[14, 1]) << 1     # Ring
+    bits |= int(lm[20, 1] < lm[18, 1])          # Pinky
+    return bits
+
+# Action flags returned by process_landmarks
+ACTION_CLICK = 1
+ACTION_RIGHT_CLICK = 2
+
+def process_landmarks(lm, sx, sy, wScr, hScr):
+    """Per-frame numerics: (screen_x, screen_y, action flags) for a (21, 2) landmark array"""
+    # Cursor follows the index tip, clamped to the screen like np.interp did
+    screen_x = min(max(lm[8, 0] * sx, 0.0), float(wScr))
+    screen_y = min(max(lm[8, 1] * sy, 0.0), float(hScr))
+    
+    actions = 0
+    
+    # Pinch: squared distance against a squared threshold, no sqrt needed
+    dx = lm[8, 0] - lm[4, 0]
+    dy = lm[8, 1] - lm[4, 1]
+    if dx * dx + dy * dy < PINCH_DISTANCE * PINCH_DISTANCE:
+        actions |= ACTION_CLICK
+    
+    # Peace sign: index and middle up, others down
+    if fingers_bits(lm) == PEACE_SIGN:
+        actions |= ACTION_RIGHT_CLICK
+    
+    return screen_x, screen_y, actions
+
+# Compiled to native code when numba is installed (cached on disk between runs,
+# so only the first run pays for compilation)
+if NUMBA_AVAILABLE:
+    fingers_bits = njit(cache=True)(fingers_bits)
+    process_landmarks = njit(cache=True)(process_landmarks)
 
 def simple_cursor_control():
     """Simple cursor control without GUI"""
@@ -18,12 +95,22 @@ def simple_cursor_control():
     
     # Initialize camera
     print("📹 Initializing camera...")
-    cap = cv2.VideoCapture(0)
+    if sys.platform == "win32":
+        cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
+    elif sys.platform.startswith("linux"):
+        cap = cv2.VideoCapture(0, cv2.CAP_V4L2)
+    else:
+        cap = cv2.VideoCapture(0)
     
     if not cap.isOpened():
         print("❌ Cannot open camera!")
         return False
     
+    # MJPG frames and a 1-frame buffer so the cursor follows the newest frame
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+    if not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+        print("⚠️ Camera backend ignored CAP_PROP_BUFFERSIZE; frames may lag")
+    
     print("✅ Camera opened successfully")
     print("\n🎮 Controls:")
     print("   👆 Point finger - Move cursor")
@@ -36,48 +123,68 @@ def simple_cursor_control():
     pyautogui.FAILSAFE = False
     pyautogui.PAUSE = 0.01
     
-    def get_distance(p1, p2):
-        return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
+    # Read frames on a background thread so inference always gets the newest one
+    grabber = FrameGrabber(cap).start()
+    last_sig = None
+    result_hands = None
+    rgb_buf = None  # Reused RGB buffer for inference
+    
+    # Clicks fire once when a gesture starts, not on every frame it is held
+    pinch_was_active = peace_was_active = False
+    last_click_ts = last_right_click_ts = 0.0
+    
+    # Camera -> screen scale factors, recomputed only if the frame size changes
+    frame_dims = None
+    sx = sy = 1.0
+    
+    instructions_mask = render_instructions_mask()
     
     try:
         while True:
-            success, img = cap.read()
+            success, img = grabber.read()
             if not success:
                 print("❌ Failed to read frame")
                 break
             
             # Flip image for mirror effect
             img = cv2.flip(img, 1)
-            img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
             
-            # Process hand detection
-            result_hands = hands.process(img_rgb)
+            # Process hand detection, reusing the last result for a repeated frame
+            sig = frame_signature(img)
+            if sig != last_sig or result_hands is None:
+                if rgb_buf is None or rgb_buf.shape != img.shape:
+                    rgb_buf = np.empty_like(img)
+                img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+                result_hands = hands.process(img_rgb)
+                last_sig = sig
             h, w, _ = img.shape
+            pinch_active = peace_active = False
             
             if result_hands.multi_hand_landmarks:
                 for hand_landmarks in result_hands.multi_hand_landmarks:
                     # Draw landmarks
                     mp_draw.draw_landmarks(img, hand_landmarks, mp_hands.HAND_CONNECTIONS)
                     
-                    # Get landmark positions
-                    lmList = []
-                    for id, lm in enumerate(hand_landmarks.landmark):
-                        cx, cy = int(lm.x * w), int(lm.y * h)
-                        lmList.append((cx, cy))
+                    # Get landmark positions as a (21, 2) pixel array in one pass
+                    landmarks = hand_landmarks.landmark
+                    lmList = (np.fromiter((c for lm in landmarks for c in (lm.x, lm.y)),
+                                          dtype=np.float32, count=2 * len(landmarks))
+                              .reshape(-1, 2) * (w, h)).astype(np.int32)
                     
                     if len(lmList) >= 21:
-                        # Key positions
-                        index_tip = lmList[8]    # Index finger tip
-                        thumb_tip = lmList[4]    # Thumb tip
-                        middle_tip = lmList[12]  # Middle finger tip
+                        # Key positions (plain int tuples for OpenCV drawing)
+                        index_tip = tuple(lmList[8].tolist())    # Index finger tip
+                        thumb_tip = tuple(lmList[4].tolist())    # Thumb tip
                         
                         x1, y1 = index_tip
-                        x2, y2 = thumb_tip
-                        x3, y3 = middle_tip
+                        
+                        # Cursor position and gesture actions in one compiled call
+                        if (w, h) != frame_dims:
+                            frame_dims = (w, h)
+                            sx, sy = wScr / w, hScr / h
+                        screen_x, screen_y, actions = process_landmarks(lmList, sx, sy, wScr, hScr)
                         
                         # 1. Move cursor with index finger
-                        screen_x = np.interp(x1, [0, w], [0, wScr])
-                        screen_y = np.interp(y1, [0, h], [0, hScr])
                         pyautogui.moveTo(screen_x, screen_y)
                         
                         # Draw cursor indicator
@@ -86,9 +193,12 @@ def simple_cursor_control():
                                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
                         
                         # 2. Click with pinch
-                        pinch_distance = get_distance(index_tip, thumb_tip)
-                        if pinch_distance < 40:
-                            pyautogui.click()
+                        if actions & ACTION_CLICK:
+                            pinch_active = True
+                            now = time.monotonic()
+                            if not pinch_was_active and now - last_click_ts > CLICK_COOLDOWN:
+                                pyautogui.click()
+                                last_click_ts = now
                             cv2.circle(img, index_tip, 15, (0, 0, 255), 3)
                             cv2.circle(img, thumb_tip, 15, (0, 0, 255), 3)
                             cv2.line(img, index_tip, thumb_tip, (0, 0, 255), 3)
@@ -96,34 +206,22 @@ def simple_cursor_control():
                                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
                         
                         # 3. Right click with peace sign
-                        # Check finger states
-                        fingers_up = []
-                        # Thumb
-                        fingers_up.append(1 if lmList[4][0] > lmList[3][0] else 0)
-                        # Index
-                        fingers_up.append(1 if lmList[8][1] < lmList[6][1] else 0)
-                        # Middle
-                        fingers_up.append(1 if lmList[12][1] < lmList[10][1] else 0)
-                        # Ring
-                        fingers_up.append(1 if lmList[16][1] < lmList[14][1] else 0)
-                        # Pinky
-                        fingers_up.append(1 if lmList[20][1] < lmList[18][1] else 0)
-                        
-                        # Peace sign: index and middle up, others down
-                        if fingers_up == [0, 1, 1, 0, 0]:
-                            pyautogui.rightClick()
+                        if actions & ACTION_RIGHT_CLICK:
+                            peace_active = True
+                            now = time.monotonic()
+                            if not peace_was_active and now - last_right_click_ts > CLICK_COOLDOWN:
+                                pyautogui.rightClick()
+                                last_right_click_ts = now
                             cv2.putText(img, 'RIGHT CLICK!', (x1, y1 - 80), 
                                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
             
-            # Show instructions on screen
-            cv2.putText(img, "Point finger to move cursor", (10, 30), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-            cv2.putText(img, "Pinch to click", (10, 60), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-            cv2.putText(img, "Peace sign for right click", (10, 90), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-            cv2.putText(img, "Press 'q' to quit", (10, 120), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+            pinch_was_active, peace_was_active = pinch_active, peace_active
+            
+            # Show instructions on screen (pre-rendered mask, clipped to the frame)
+            x1, y1, x2, y2 = INSTRUCTIONS_BOX
+            roi = img[y1:y2 + 1, x1:x2 + 1]
+            roi_h, roi_w = roi.shape[:2]
+            roi[instructions_mask[:roi_h, :roi_w]] = 255
             
             # Display image
             cv2.imshow("Simple Cursor Controller", img)
@@ -136,6 +234,7 @@ def simple_cursor_control():
         print("\n🛑 Stopping...")
     
     finally:
+        grabber.stop()
         cap.release()
         cv2.destroyAllWindows()
         hands.close()
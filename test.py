@@ -1,64 +1,213 @@
-import cv2
+import argparse
+import importlib.util
+import json
+import os
+import queue
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-def test_camera():
-    """Test if camera is working"""
-    print("🔍 Testing camera...")
+# Seconds between preview frames actually decoded and shown (~15 fps); frames
+# in between are only grabbed, which halves the decode and HighGUI work
+PREVIEW_INTERVAL = 1 / 15
+
+# Length of the camera test preview in seconds (--interactive only)
+PREVIEW_SECONDS = 3
+
+# Headless camera check: frames read, and the minimum mean/std deviation of pixel
+# values for a frame to count as a live image rather than a black or frozen one
+VALIDATION_FRAMES = 5
+MIN_FRAME_MEAN = 1.0
+MIN_FRAME_STD = 5.0
+
+# Capture format requested before the first read, so the driver doesn't have
+# to auto-detect it (MJPG keeps 640x480@30 well within USB bandwidth)
+MJPG_FOURCC = 'MJPG'
+TEST_RESOLUTION = (640, 480)
+TEST_FPS = 30
+
+# Stale frames drained before the first read: stop once a grab takes longer than
+# LIVE_GRAB_SECONDS (it had to wait for the camera, so the buffer is empty)
+DRAIN_MAX_GRABS = 8
+LIVE_GRAB_SECONDS = 0.005
+
+# Per-user cache for results that don't need re-checking on every run
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gesture_cursor")
+
+# A successful MediaPipe model load is trusted for this long (same version only)
+MEDIAPIPE_OK_MAX_AGE = 24 * 60 * 60
+
+# Low-latency GStreamer pipeline for Linux: appsink keeps a single frame and
+# drops older ones instead of queueing them
+GSTREAMER_PIPELINE = ("v4l2src device=/dev/video0 ! video/x-raw,framerate=30/1 ! "
+                      "videoconvert ! video/x-raw,format=BGR ! "
+                      "appsink max-buffers=1 drop=true sync=false")
+
+# Dummy inferences run to warm up (and time) the MediaPipe hands graph
+WARMUP_ITERATIONS = 3
+
+# Timed inferences after the warm-up; their median picks the device tier
+BENCHMARK_ITERATIONS = 10
+
+# Device tiers as (name, upper median ms bound, recommended settings), fastest first.
+# The settings are app setting keys, applied by core.settings_manager on startup
+DEVICE_TIERS = (
+    ("high", 15, {"model_complexity": 1, "inference_width": 640}),
+    ("medium", 40, {"model_complexity": 0, "inference_width": 480}),
+    ("low", float("inf"), {"model_complexity": 0, "inference_width": 320}),
+)
+
+# Benchmark result and recommended settings (same path as
+# core.settings_manager.DEVICE_PROFILE_FILE, which reads it)
+DEVICE_PROFILE_FILE = os.path.join(CACHE_DIR, "device_profile.json")
+
+def put_latest(q, item):
+    """Put an item into a size-1 queue, replacing any unconsumed one"""
+    try:
+        q.put_nowait(item)
+    except queue.Full:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        q.put_nowait(item)
+
+def flush_messages(msgs):
+    """Print buffered progress lines with a single write and clear the buffer"""
+    if msgs:
+        print("\n".join(msgs), flush=True)
+        msgs.clear()
+
+def frames_look_live(cap):
+    """Read a few frames and check they are neither black nor constant"""
+    for _ in range(VALIDATION_FRAMES):
+        ret, frame = cap.read()
+        if not ret or frame.mean() <= MIN_FRAME_MEAN or frame.std() <= MIN_FRAME_STD:
+            return False
+    return True
+
+def preview_camera(cap, frames=None, stop=None):
+    """Show the camera feed for PREVIEW_SECONDS; with a frames queue the caller shows it"""
+    import cv2
+    
+    # OpenCV's tick counter: one C call per check, no time-module chain
+    tick_freq = cv2.getTickFrequency()
+    now = next_display = cv2.getTickCount()
+    end_tick = now + PREVIEW_SECONDS * tick_freq
+    
+    while now < end_tick:
+        # grab() advances the stream without decoding; only frames
+        # that are actually shown get decoded by retrieve()
+        grabbed = cap.grab()
+        now = cv2.getTickCount()
+        if not grabbed or now < next_display:
+            continue
+        next_display += PREVIEW_INTERVAL * tick_freq
+        
+        ret, frame = cap.retrieve()
+        if not ret:
+            continue
+        
+        # HighGUI isn't thread-safe: off the main thread, hand frames over
+        if frames is not None:
+            put_latest(frames, frame)
+            if stop.is_set():
+                break
+        else:
+            cv2.imshow("Camera Test", frame)
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
     
-    # Try different camera backends
-    backends = [
-        (cv2.CAP_DSHOW, "DirectShow (Windows)"),
-        (cv2.CAP_ANY, "Default backend"),
-        (0, "Basic camera")
-    ]
+    if frames is None:
+        cv2.destroyAllWindows()
+
+def test_camera(frames=None, stop=None, interactive=False):
+    """Test if camera is working; headless unless interactive (preview via frames queue if given)"""
+    # Progress lines are collected and written in batches: one stdout write per
+    # batch, and the lines stay together when the concurrent tests interleave
+    msgs = ["🔍 Testing camera..."]
+    
+    try:
+        import cv2
+    except ImportError as e:
+        msgs.append(f"❌ OpenCV error: {e}")
+        flush_messages(msgs)
+        return False
     
-    for backend, name in backends:
-        print(f"\n📹 Trying {name}...")
+    # Try different camera backends. DirectShow only exists on Windows, and
+    # VideoCapture(0) without a backend is the same CAP_ANY probe, so each slow
+    # open is attempted only once
+    backends = [(0, cv2.CAP_ANY, "Default backend")]
+    if sys.platform == "win32":
+        backends.insert(0, (0, cv2.CAP_DSHOW, "DirectShow (Windows)"))
+    elif sys.platform.startswith("linux"):
+        # Only works when OpenCV was built with GStreamer; otherwise it fails to open
+        backends.insert(0, (GSTREAMER_PIPELINE, cv2.CAP_GSTREAMER, "GStreamer low-latency"))
+    
+    for source, backend, name in backends:
+        msgs.append(f"\n📹 Trying {name}...")
         
+        cap = None
         try:
-            if backend == 0:
-                cap = cv2.VideoCapture(0)
-            else:
-                cap = cv2.VideoCapture(0, backend)
+            cap = cv2.VideoCapture(source, backend)
             
-            if cap.isOpened():
-                print(f"✅ {name} - SUCCESS")
+            # A backend that "opens" without a frame size can't deliver frames;
+            # fail fast instead of waiting on a read
+            if cap.isOpened() and cap.get(cv2.CAP_PROP_FRAME_WIDTH) <= 0:
+                msgs.append(f"   ❌ {name} - No frame size reported")
+            elif cap.isOpened():
+                msgs.append(f"✅ {name} - SUCCESS")
+                
+                # Keep only the newest frame queued so the preview isn't frames behind
+                if not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+                    msgs.append("   ⚠️ Failed to reduce capture buffer size. Latency will be higher!")
                 
-                # Test reading frames
-                ret, frame = cap.read()
-                if ret:
+                # Negotiate the format up front (the GStreamer pipeline fixes its own)
+                if backend != cv2.CAP_GSTREAMER:
+                    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*MJPG_FOURCC))
+                    cap.set(cv2.CAP_PROP_FRAME_WIDTH, TEST_RESOLUTION[0])
+                    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, TEST_RESOLUTION[1])
+                    cap.set(cv2.CAP_PROP_FPS, TEST_FPS)
+                
+                # Test reading frames, starting from a live one rather than a buffered one
+                for _ in range(DRAIN_MAX_GRABS):
+                    start = time.perf_counter()
+                    if not cap.grab() or time.perf_counter() - start > LIVE_GRAB_SECONDS:
+                        break
+                ret, frame = cap.retrieve()
+                if not ret:
+                    msgs.append(f"   ❌ {name} - Can't read frames")
+                elif not interactive and not frames_look_live(cap):
+                    msgs.append(f"   ❌ {name} - Frames are black or frozen")
+                else:
                     h, w, c = frame.shape
-                    print(f"   📐 Resolution: {w}x{h}")
-                    print(f"   🎨 Channels: {c}")
+                    msgs.append(f"   📐 Resolution: {w}x{h}")
+                    msgs.append(f"   🎨 Channels: {c}")
                     
-                    # Show camera feed for 3 seconds
-                    print("   📺 Showing camera feed for 3 seconds...")
-                    import time
-                    start_time = time.time()
+                    if interactive:
+                        # Show camera feed for 3 seconds
+                        msgs.append("   📺 Showing camera feed for 3 seconds...")
+                        flush_messages(msgs)
+                        preview_camera(cap, frames, stop)
                     
-                    while time.time() - start_time < 3:
-                        ret, frame = cap.read()
-                        if ret:
-                            cv2.imshow("Camera Test", frame)
-                            if cv2.waitKey(1) & 0xFF == ord('q'):
-                                break
-                    
-                    cv2.destroyAllWindows()
                     cap.release()
-                    print("   ✅ Camera test successful!")
+                    msgs.append("   ✅ Camera test successful!")
+                    flush_messages(msgs)
                     return True
-                else:
-                    print(f"   ❌ {name} - Can't read frames")
             else:
-                print(f"   ❌ {name} - Can't open camera")
+                msgs.append(f"   ❌ {name} - Can't open camera")
             
             if cap:
                 cap.release()
                 
         except Exception as e:
-            print(f"   ❌ {name} - Error: {e}")
+            msgs.append(f"   ❌ {name} - Error: {e}")
+            if cap:
+                cap.release()
     
-    print("\n❌ No working camera found!")
+    msgs.append("\n❌ No working camera found!")
+    flush_messages(msgs)
     return False
 
 def test_mediapipe():
@@ -69,30 +218,113 @@ def test_mediapipe():
         import mediapipe as mp
         print("✅ MediaPipe imported successfully")
         
+        # Skip the model load if this MediaPipe version loaded it recently
+        # and the device has already been benchmarked
+        sentinel = os.path.join(CACHE_DIR, f"mp_hands_ok_{mp.__version__}")
+        try:
+            if (time.time() - os.path.getmtime(sentinel) < MEDIAPIPE_OK_MAX_AGE
+                    and os.path.exists(DEVICE_PROFILE_FILE)):
+                print("✅ MediaPipe Hands model loaded recently (cached result)")
+                return True
+        except OSError:
+            pass
+        
         # Test hands model
         mp_hands = mp.solutions.hands
         hands = mp_hands.Hands(max_num_hands=1, min_detection_confidence=0.7)
         print("✅ MediaPipe Hands model loaded")
+        
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(sentinel, "w") as f:
+                f.write(str(time.time()))
+        except OSError as e:
+            print(f"   ⚠️ Could not cache MediaPipe result: {e}")
+        
+        # Warm-up inferences: the first call builds the graph and allocates
+        # buffers, so report both it and the median of the warm runs
+        import statistics
+        import numpy as np
+        dummy = np.zeros((480, 640, 3), np.uint8)  # Black, so BGR and RGB are identical
+        timings = []
+        for _ in range(WARMUP_ITERATIONS):
+            t0 = time.perf_counter()
+            hands.process(dummy)
+            timings.append((time.perf_counter() - t0) * 1000)
+        print(f"   ⏱️ First inference: {timings[0]:.1f} ms, "
+              f"median (p50): {statistics.median(timings):.1f} ms")
+        
+        # Mini-benchmark on the warm graph to classify the device
+        timings = []
+        for _ in range(BENCHMARK_ITERATIONS):
+            t0 = time.perf_counter()
+            hands.process(dummy)
+            timings.append((time.perf_counter() - t0) * 1000)
         hands.close()
+        write_device_profile(statistics.median(timings))
         
         return True
     except Exception as e:
         print(f"❌ MediaPipe error: {e}")
         return False
 
+def native_screen_info():
+    """(width, height, mouse_x, mouse_y) straight from the OS, or None if unavailable"""
+    # Only Windows for now: two user32 calls instead of importing pyautogui
+    if sys.platform != "win32":
+        return None
+    
+    try:
+        import ctypes
+        from ctypes import wintypes
+        user32 = ctypes.windll.user32
+        # pyautogui makes the app DPI-aware; without this, scaled displays
+        # report a logical size instead of the pixels the cursor code uses
+        user32.SetProcessDPIAware()
+        point = wintypes.POINT()
+        if not user32.GetCursorPos(ctypes.byref(point)):
+            return None
+        return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1), point.x, point.y
+    except Exception:
+        return None
+
+def write_device_profile(median_ms):
+    """Classify the device by inference time, print and save the recommended settings"""
+    tier, recommended = next((name, settings) for name, bound, settings in DEVICE_TIERS
+                             if median_ms < bound)
+    print(f"   📊 Benchmark median: {median_ms:.1f} ms → {tier} performance device")
+    print(f"   💡 Recommended: model_complexity={recommended['model_complexity']}, "
+          f"inference width {recommended['inference_width']}px "
+          f"(applied the next time main.py starts)")
+    
+    profile = {"tier": tier, "median_ms": round(median_ms, 2),
+               "measured_at": time.time(), **recommended}
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(DEVICE_PROFILE_FILE, "w") as f:
+            json.dump(profile, f, indent=4)
+    except OSError as e:
+        print(f"   ⚠️ Could not save device profile: {e}")
+
 def test_pyautogui():
     """Test PyAutoGUI"""
     print("\n🖱️ Testing PyAutoGUI...")
     
     try:
-        import pyautogui
+        # Check it's installed without paying for its import (Pillow, pytweening, ...)
+        if importlib.util.find_spec("pyautogui") is None:
+            raise ImportError("No module named 'pyautogui'")
+        
+        screen = native_screen_info()
+        if screen is None:
+            import pyautogui
+            screen = (*pyautogui.size(), *pyautogui.position())
+        width, height, x, y = screen
         
         # Get screen size
-        width, height = pyautogui.size()
         print(f"✅ Screen size: {width}x{height}")
         
         # Test getting mouse position
-        x, y = pyautogui.position()
         print(f"✅ Current mouse position: ({x}, {y})")
         
         return True
@@ -100,35 +332,82 @@ def test_pyautogui():
         print(f"❌ PyAutoGUI error: {e}")
         return False
 
+def show_preview(camera_future, frames, stop):
+    """Show the camera test's frames from the main thread until the test ends"""
+    shown = False
+    while not camera_future.done():
+        try:
+            frame = frames.get(timeout=0.05)
+        except queue.Empty:
+            continue
+        
+        # Only reached once the camera test has imported OpenCV successfully
+        import cv2
+        cv2.imshow("Camera Test", frame)
+        shown = True
+        if cv2.waitKey(1) & 0xFF == ord('q'):
+            stop.set()
+    if shown:
+        cv2.destroyAllWindows()
+
+# Test name -> (label, failure hint); each test imports its own heavy modules
+TESTS = {
+    "camera": ("📹 Camera", "Check if webcam is connected and not used by other apps"),
+    "mediapipe": ("🤖 MediaPipe", "Try reinstalling with: pip install mediapipe"),
+    "pyautogui": ("🖱️ PyAutoGUI", "Try reinstalling with: pip install pyautogui"),
+}
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Cursor Controller - System Test")
+    parser.add_argument("--only", action="append", choices=list(TESTS),
+                        help="run only this test (can be given more than once)")
+    parser.add_argument("--interactive", action="store_true",
+                        help="show a live camera preview instead of the headless frame check")
+    return parser.parse_args()
+
 def main():
     """Run all tests"""
+    args = parse_args()
+    selected = [name for name in TESTS if not args.only or name in args.only]
+    
     print("🧪 Cursor Controller - System Test")
     print("=" * 40)
     
-    # Test all components
-    camera_ok = test_camera()
-    mediapipe_ok = test_mediapipe()
-    pyautogui_ok = test_pyautogui()
+    # Test all components concurrently; the camera preview overlaps MediaPipe
+    # model loading. Their progress lines may interleave
+    frames = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=len(selected)) as executor:
+        futures = {}
+        if "camera" in selected:
+            futures["camera"] = executor.submit(test_camera, frames, stop, args.interactive)
+        if "mediapipe" in selected:
+            futures["mediapipe"] = executor.submit(test_mediapipe)
+        if "pyautogui" in selected:
+            futures["pyautogui"] = executor.submit(test_pyautogui)
+        
+        if args.interactive and "camera" in futures:
+            show_preview(futures["camera"], frames, stop)
+        
+        results = {name: future.result() for name, future in futures.items()}
     
     print("\n" + "=" * 40)
     print("📊 TEST RESULTS")
     print("=" * 40)
-    print(f"📹 Camera: {'✅ PASS' if camera_ok else '❌ FAIL'}")
-    print(f"🤖 MediaPipe: {'✅ PASS' if mediapipe_ok else '❌ FAIL'}")
-    print(f"🖱️ PyAutoGUI: {'✅ PASS' if pyautogui_ok else '❌ FAIL'}")
+    for name, ok in results.items():
+        print(f"{TESTS[name][0]}: {'✅ PASS' if ok else '❌ FAIL'}")
     
-    if camera_ok and mediapipe_ok and pyautogui_ok:
+    if all(results.values()):
         print("\n🎉 All tests passed! Your system is ready.")
         print("💡 You can now run: python main.py")
     else:
         print("\n❌ Some tests failed. Please fix the issues above.")
         
-        if not camera_ok:
-            print("   📹 Camera: Check if webcam is connected and not used by other apps")
-        if not mediapipe_ok:
-            print("   🤖 MediaPipe: Try reinstalling with: pip install mediapipe")
-        if not pyautogui_ok:
-            print("   🖱️ PyAutoGUI: Try reinstalling with: pip install pyautogui")
+        for name, ok in results.items():
+            if not ok:
+                label, hint = TESTS[name]
+                print(f"   {label}: {hint}")
     
     input("\nPress Enter to exit...")
 